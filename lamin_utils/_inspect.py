@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from ._colors import colors
 from ._logger import logger
-from ._map_synonyms import map_synonyms, to_str
+from ._map_synonyms import _check_fields, _map_synonym_keys, to_str
+from ._vocabulary import _DiskVocabulary
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -17,16 +20,22 @@ class InspectResult:
     """Result of inspect.
 
     An InspectResult object of calls such as :meth:`~lamindb.models.CanCurate.inspect`.
+
+    If constructed from `identifiers` and their boolean `matches`, the DataFrame,
+    the (non-)validated terms and the counts are computed on first access.
     """
 
     def __init__(
         self,
-        validated_df: pd.DataFrame,
-        validated: list[str],
-        nonvalidated: list[str],
-        frac_validated: float,
-        n_empty: int,
-        n_unique: int,
+        validated_df: pd.DataFrame | None = None,
+        validated: list[str] | None = None,
+        nonvalidated: list[str] | None = None,
+        frac_validated: float | None = None,
+        n_empty: int | None = None,
+        n_unique: int | None = None,
+        *,
+        identifiers: list | None = None,
+        matches: np.ndarray | None = None,
     ) -> None:
         self._df = validated_df
         self._validated = validated
@@ -34,16 +43,55 @@ class InspectResult:
         self._frac_validated = frac_validated
         self._n_empty = n_empty
         self._n_unique = n_unique
+        self._identifiers = identifiers
+        self._matches = matches
         self._synonyms_mapper: dict = {}
 
+    def _compute_stats(self) -> None:
+        """Compute the (non-)validated terms and the counts from the matches."""
+        import numpy as np
+        import pandas as pd
+
+        index = pd.Index(self._identifiers)
+        matches = np.asarray(self._matches, dtype=bool)
+        self._validated = _unique_rm_empty(index[matches]).tolist()
+        self._non_validated = _unique_rm_empty(index[~matches]).tolist()
+        self._n_unique = len(self._validated) + len(self._non_validated)
+        if self._n_unique == 0:
+            self._frac_validated = 0
+            self._n_empty = 0
+            return
+        self._n_empty = len(index) - self._n_unique
+        frac_nonval = round(len(self._non_validated) / self._n_unique * 100, 1)
+        self._frac_validated = 100 - frac_nonval
+
     @property
     def df(self) -> pd.DataFrame:
-        """A DataFrame indexed by values with a boolean `__validated__` column."""
+        """A DataFrame indexed by values with a boolean `__validated__` column.
+
+        Raises:
+            ValueError: If the result holds no identifiers, as for
+                :func:`~lamin_utils._inspect_stream.inspect_stream`.
+        """
+        if self._df is None:
+            import pandas as pd
+
+            if self._identifiers is None:
+                raise ValueError(
+                    "this result has no DataFrame, it was computed without keeping"
+                    " the identifiers, use `validated` and `non_validated` instead"
+                )
+
+            self._df = pd.DataFrame(
+                data={"__validated__": self._matches}, index=self._identifiers
+            )
         return self._df
 
     @property
     def validated(self) -> list[str]:
         """List of successfully :meth:`~lamindb.models.CanCurate.validate` validated items."""
+        if self._validated is None:
+            self._compute_stats()
         return self._validated
 
     @property
@@ -53,21 +101,29 @@ class InspectResult:
         This list can be used to remove any non-validated values such as
         genes that do not map against the specified source.
         """
+        if self._non_validated is None:
+            self._compute_stats()
         return self._non_validated
 
     @property
     def frac_validated(self) -> float:
         """Fraction of items that were validated."""
+        if self._frac_validated is None:
+            self._compute_stats()
         return self._frac_validated
 
     @property
     def n_empty(self) -> int:
         """Number of empty items."""
+        if self._n_empty is None:
+            self._compute_stats()
         return self._n_empty
 
     @property
     def n_unique(self) -> int:
         """Number of unique items."""
+        if self._n_unique is None:
+            self._compute_stats()
         return self._n_unique
 
     @property
@@ -116,7 +172,8 @@ def validate(
 
     Args:
         identifiers: The iterable containing elements to be validated.
-        field_values: The iterable containing valid values to check against.
+        field_values: The iterable containing valid values to check against, or an
+            on-disk vocabulary such as :class:`HashedVocabulary`.
         case_sensitive: If True, the comparison is case-sensitive.
         mute: If True, suppresses logging output
         field: Name of the field being validated, used in logging.
@@ -131,26 +188,285 @@ def validate(
     """
     if isinstance(kwargs.get("logging"), bool):
         mute = not kwargs.get("logging")
-    import pandas as pd
+    identifiers = list(identifiers)
+    if isinstance(field_values, _DiskVocabulary):
+        _check_type_compatibility(identifiers, [field_values._sample])
+        matches = field_values.isin(identifiers, case_sensitive=case_sensitive)
+    else:
+        _check_type_compatibility(identifiers, field_values)
+        matches = _validate_values(identifiers, field_values, case_sensitive)
+    if not mute:
+        if len(identifiers) == 0:
+            logger.warning("input has zero length")
+        else:
+            _validate_logging(
+                _validate_stats(identifiers=identifiers, matches=matches), field=field
+            )
+    return matches
 
-    _check_type_compatibility(identifiers, field_values)
 
-    identifiers = list(identifiers)
+def _validate_values(
+    identifiers: list, field_values: Iterable, case_sensitive: bool
+) -> np.ndarray:
+    import pandas as pd
+
+    numeric_identifiers = _numeric_values(identifiers)
+    numeric_field_values = (
+        None if numeric_identifiers is None else _numeric_values(field_values)
+    )
+    if numeric_field_values is not None:
+        # numbers are matched as is, they have no casing
+        return _numeric_isin(numeric_identifiers, numeric_field_values)
     identifiers_idx = pd.Index(identifiers)
     identifiers_idx = to_str(identifiers_idx, case_sensitive=case_sensitive)
 
     field_values = to_str(field_values, case_sensitive=case_sensitive)
 
     # annotated what complies with the default ID
-    matches = identifiers_idx.isin(field_values)
-    if not mute:
-        if len(identifiers) == 0:
-            logger.warning("input has zero length")
+    return _isin(identifiers_idx, field_values)
+
+
+class Validator:
+    """Validates identifiers against a fixed set of field values.
+
+    The field values are normalized and hashed once, for both case-sensitive and
+    case-insensitive matching. Validating a batch of identifiers then only
+    normalizes and looks up the batch. A Validator is read-only after
+    construction and can be shared between threads.
+
+    Args:
+        field_values: The iterable containing valid values to check against.
+
+    Examples:
+        >>> validator = Validator(genes_df["symbol"])
+        >>> validator.validate(["A1CF", "a1cf"], case_sensitive=False)
+        array([ True,  True])
+    """
+
+    def __init__(self, field_values: Iterable) -> None:
+        import pandas as pd
+
+        if isinstance(field_values, pd.Categorical):
+            field_values = pd.Series(field_values)
+        elif not isinstance(field_values, pd.Series | pd.Index):
+            field_values = pd.Series(list(field_values), dtype=object)
+        # first value for the type compatibility check
+        self._sample = next(iter(field_values), None)
+        numeric_values = _numeric_values(field_values)
+        self._numbers: pd.Index | None = None
+        if numeric_values is not None:
+            # unique numbers for the numeric fast path
+            self._numbers = pd.Index(pd.unique(numeric_values))
+            _ = self._numbers.is_unique
+        keys = to_str(field_values, case_sensitive=True)
+        self._keys = _unique_object_index(keys)
+        try:
+            self._folded_keys: pd.Index | None = _unique_object_index(keys.str.lower())
+        except AttributeError:
+            # non-string values can't be matched case-insensitively
+            self._folded_keys = None
+
+    def validate(
+        self,
+        identifiers: Iterable,
+        *,
+        case_sensitive: bool = True,
+        mute: bool = False,
+        field: str | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        """Check if elements in an iterable are present in the field values.
+
+        Same as :func:`validate` with the field values of the Validator.
+
+        Args:
+            identifiers: The iterable containing elements to be validated.
+            case_sensitive: If True, the comparison is case-sensitive.
+            mute: If True, suppresses logging output
+            field: Name of the field being validated, used in logging.
+            **kwargs: Additional keyword arguments.
+                logging: If provided as a boolean, overrides the 'mute' parameter.
+
+        Returns:
+            A boolean numpy array where True indicates a valid element and False an invalid one.
+        """
+        if isinstance(kwargs.get("logging"), bool):
+            mute = not kwargs.get("logging")
+        import numpy as np
+        import pandas as pd
+
+        identifiers = list(identifiers)
+        _check_type_compatibility(identifiers, [self._sample])
+        numeric_identifiers = (
+            None if self._numbers is None else _numeric_values(identifiers)
+        )
+        if numeric_identifiers is not None:
+            matches = self._numbers.get_indexer(numeric_identifiers) >= 0
         else:
-            _validate_logging(
-                _validate_stats(identifiers=identifiers, matches=matches), field=field
+            keys = to_str(pd.Index(identifiers), case_sensitive=case_sensitive)
+            field_keys = self._keys if case_sensitive else self._folded_keys
+            if field_keys is None:
+                raise AttributeError("Can only use .str accessor with string values!")
+            matches = field_keys.get_indexer(np.asarray(keys, dtype=object)) >= 0
+        if not mute:
+            if len(identifiers) == 0:
+                logger.warning("input has zero length")
+            else:
+                _validate_logging(
+                    _validate_stats(identifiers=identifiers, matches=matches),
+                    field=field,
+                )
+        return matches
+
+
+def validate_many(
+    df: pd.DataFrame,
+    references: dict[str, Iterable | Validator | _DiskVocabulary],
+    *,
+    case_sensitive: bool = True,
+    n_jobs: int | None = 1,
+    mute: bool = False,
+) -> tuple[dict[str, InspectResult], pd.DataFrame]:
+    """Validates multiple columns of a DataFrame against their field values.
+
+    Each distinct reference is normalized once into a :class:`Validator`, even if
+    several columns are validated against it. Columns are validated concurrently
+    and logged together.
+
+    Args:
+        df: DataFrame with the columns to validate.
+        references: The valid values for each column to validate, either an
+            iterable of field values, a :class:`Validator` or an on-disk vocabulary.
+            Columns that pass the same object share its normalization.
+        case_sensitive: If True, the comparison is case-sensitive.
+        n_jobs: Number of threads that validate columns.
+            `None` or `-1` uses all CPUs.
+        mute: If True, suppresses logging.
+
+    Returns:
+        A tuple of an InspectResult per column and a DataFrame of validation
+        statistics indexed by column: the number of unique values, how many of
+        them were validated or not, the number of empty/duplicated values and the
+        validated percentage.
+
+    Examples:
+        >>> results, summary = validate_many(
+        ...     adata.obs,
+        ...     {"cell_type": cell_types_df["name"], "tissue": tissues_df["name"]},
+        ... )
+    """
+    import pandas as pd
+
+    if n_jobs is None or n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    for column in references:
+        if column not in df.columns:
+            raise KeyError(
+                f"column '{column}' is invalid! Available columns are: {list(df.columns)}"
             )
-    return matches
+    # {id of the reference: reference}
+    distinct: dict[int, Any] = {}
+    for reference in references.values():
+        distinct.setdefault(id(reference), reference)
+
+    def make_validator(reference: Any) -> Validator | _DiskVocabulary:
+        if isinstance(reference, Validator | _DiskVocabulary):
+            return reference
+        return Validator(reference)
+
+    def validate_column(column: str) -> InspectResult:
+        # only the distinct values of a column are looked up
+        codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+        uniques = uniques.tolist()
+        validator = validators[id(references[column])]
+        if isinstance(validator, _DiskVocabulary):
+            _check_type_compatibility(uniques, [validator._sample])
+            matches = validator.isin(uniques, case_sensitive=case_sensitive)
+        else:
+            matches = validator.validate(
+                uniques, case_sensitive=case_sensitive, mute=True
+            )
+        result = _validate_stats(
+            identifiers=df[column].tolist(), matches=matches[codes]
+        )
+        # statistics are computed in the worker thread
+        _ = result.frac_validated
+        return result
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(n_jobs, len(references)))
+    ) as executor:
+        validators = dict(
+            zip(
+                distinct,
+                executor.map(make_validator, distinct.values()),
+                strict=True,
+            )
+        )
+        results = dict(
+            zip(references, executor.map(validate_column, references), strict=True)
+        )
+
+    summary = pd.DataFrame.from_dict(
+        {
+            column: {
+                "n_unique": result.n_unique,
+                "n_validated": len(result.validated),
+                "n_non_validated": len(result.non_validated),
+                "n_empty": result.n_empty,
+                "frac_validated": result.frac_validated,
+            }
+            for column, result in results.items()
+        },
+        orient="index",
+        columns=[
+            "n_unique",
+            "n_validated",
+            "n_non_validated",
+            "n_empty",
+            "frac_validated",
+        ],
+    )
+    if not mute:
+        _validate_many_logging(summary)
+    return results, summary
+
+
+def _validate_many_logging(summary: pd.DataFrame) -> None:
+    """Logging of the validation summary of multiple columns to stdout."""
+    validated = summary.index[summary["n_non_validated"] == 0].tolist()
+    non_validated = summary[summary["n_non_validated"] > 0]
+    if len(validated) > 0:
+        s = "" if len(validated) == 1 else "s"
+        are = "is" if len(validated) == 1 else "are"
+        print_values = ", ".join([f"'{column}'" for column in validated])
+        logger.success(
+            f"{colors.green(f'{len(validated)} column{s}')} {are} validated:"
+            f" {print_values}"
+        )
+    if len(non_validated) > 0:
+        s = "" if len(non_validated) == 1 else "s"
+        have = "has" if len(non_validated) == 1 else "have"
+        print_values = ", ".join(
+            f"'{row.Index}' ({row.n_non_validated} unique"
+            f" term{'' if row.n_non_validated == 1 else 's'},"
+            f" {100 - row.frac_validated:.2f}%)"
+            for row in non_validated.itertuples()
+        )
+        logger.warning(
+            f"{colors.yellow(f'{len(non_validated)} column{s}')} {have} terms that"
+            f" are not validated: {colors.yellow(print_values)}"
+        )
+
+
+def _unique_object_index(values: pd.Series | pd.Index) -> pd.Index:
+    """Unique values as an object Index with a populated hash table."""
+    import pandas as pd
+
+    index = pd.Index(pd.unique(values.to_numpy(dtype=object)), dtype=object)
+    # builds the hash table now instead of on the first, possibly concurrent, lookup
+    _ = index.is_unique
+    return index
 
 
 def _check_type_compatibility(identifiers: Iterable, field_values: Iterable) -> None:
@@ -159,29 +475,12 @@ def _check_type_compatibility(identifiers: Iterable, field_values: Iterable) ->
     Raises:
         TypeError: If the high level data types do not match.
     """
-    import math
-
-    import numpy as np
-    import pandas as pd
-
     # Only look at the first element because we assume that the dtype is consistent for efficiency
     id_sample, value_sample = (
         next(iter(identifiers), None),
         next(iter(field_values), None),
     )
 
-    def _is_nan(value) -> bool:
-        if isinstance(value, (float, np.floating)):
-            return math.isnan(value) or np.isnan(value)
-        return False
-
-    def _get_type_category(value):
-        if isinstance(value, (int, float, complex, np.number)):
-            return "numeric"
-        elif isinstance(value, (str, np.str_, pd.Categorical)):
-            return "str/categorical"
-        return "unknown"
-
     # Real world data may have Nones and nan values. We can pass over them.
     if (
         id_sample is not None
@@ -190,8 +489,8 @@ def _check_type_compatibility(identifiers: Iterable, field_values: Iterable) ->
         and not _is_nan(value_sample)
     ):
         id_type, value_type = (
-            _get_type_category(id_sample),
-            _get_type_category(value_sample),
+            _type_category(id_sample),
+            _type_category(value_sample),
         )
 
         if id_type != value_type:
@@ -200,40 +499,60 @@ def _check_type_compatibility(identifiers: Iterable, field_values: Iterable) ->
             )
 
 
+def _is_nan(value) -> bool:
+    import math
+
+    import numpy as np
+
+    if isinstance(value, (float, np.floating)):
+        return math.isnan(value) or np.isnan(value)
+    return False
+
+
+def _type_category(value) -> str:
+    """High level data type of a value: numeric, str/categorical or unknown."""
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(value, (int, float, complex, np.number)):
+        return "numeric"
+    elif isinstance(value, (str, np.str_, pd.Categorical)):
+        return "str/categorical"
+    return "unknown"
+
+
+def _numeric_values(values: Iterable) -> np.ndarray | None:
+    """Values as an integer or float array, None if they aren't all numbers."""
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(values, pd.Series | pd.Index):
+        dtype = values.dtype
+        if not isinstance(dtype, np.dtype) or dtype.kind not in "iuf":
+            return None
+        return values.to_numpy()
+    values = list(values)
+    if len(values) == 0 or _type_category(values[0]) != "numeric":
+        return None
+    array = np.asarray(values)
+    return array if array.dtype.kind in "iuf" else None
+
+
+def _numeric_isin(values: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """Same as :func:`_isin` of the strings but on numbers, NaN matches NaN."""
+    import pandas as pd
+
+    return pd.Index(values).isin(reference)
+
+
 def _unique_rm_empty(idx: pd.Index):
     idx = idx.unique()
     return idx[(idx != "") & (~idx.isnull())]
 
 
 def _validate_stats(identifiers: Iterable, matches: np.ndarray):
-    import pandas as pd
-
-    df_val = pd.DataFrame(data={"__validated__": matches}, index=identifiers)
-    val = _unique_rm_empty(df_val.index[df_val["__validated__"]]).tolist()
-    nonval = _unique_rm_empty(df_val.index[~df_val["__validated__"]]).tolist()
-
-    n_unique = len(val) + len(nonval)
-    if n_unique == 0:
-        return InspectResult(
-            validated_df=df_val,
-            validated=val,
-            nonvalidated=nonval,
-            frac_validated=0,
-            n_empty=0,
-            n_unique=0,
-        )
-    n_empty = df_val.shape[0] - n_unique
-    frac_nonval = round(len(nonval) / n_unique * 100, 1)
-    frac_val = 100 - frac_nonval
-
-    return InspectResult(
-        validated_df=df_val,
-        validated=val,
-        nonvalidated=nonval,
-        frac_validated=frac_val,
-        n_empty=n_empty,
-        n_unique=n_unique,
-    )
+    # statistics are computed lazily
+    return InspectResult(identifiers=identifiers, matches=matches)
 
 
 def _validate_logging(result: InspectResult, field: str | None = None) -> None:
@@ -288,7 +607,8 @@ def inspect(
     """Inspect if a list of identifiers are mappable to the entity reference.
 
     Args:
-        df: DataFrame containing the field.
+        df: DataFrame containing the field, or an on-disk vocabulary of the field
+            such as :class:`SortedVocabulary`. Vocabularies hold no synonyms.
         identifiers: Identifiers that will be checked against the field.
         field: The BiontyField of the ontology to compare against.
                 Examples are 'ontology_id' to map against the source ID
@@ -304,9 +624,11 @@ def inspect(
     import pandas as pd
 
     identifiers = list(identifiers)
-    uniq_identifiers = _unique_rm_empty(pd.Index(identifiers)).tolist()
+    index = pd.Index(identifiers)
+    uniq_identifiers = _unique_rm_empty(index).tolist()
+    is_vocabulary = isinstance(df, _DiskVocabulary)
     # empty DataFrame or input
-    if df.shape[0] == 0 or len(uniq_identifiers) == 0:
+    if (len(df) if is_vocabulary else df.shape[0]) == 0 or len(uniq_identifiers) == 0:
         result = _validate_stats(
             identifiers=identifiers,
             matches=[False] * len(identifiers),  # type:ignore
@@ -318,16 +640,33 @@ def inspect(
         else:
             return result
 
-    # check if index is compliant with exact matches
-    matches = validate(
-        identifiers=identifiers, field_values=df[field], case_sensitive=True, mute=True
-    )
-    # matches if case sensitive is turned off
-    noncs_matches = validate(
-        identifiers=identifiers, field_values=df[field], case_sensitive=False, mute=True
-    )
-
-    msg_casing = "inconsistent casing/" if noncs_matches.sum() > matches.sum() else ""
+    numeric_field_values = None
+    _check_type_compatibility(identifiers, [df._sample] if is_vocabulary else df[field])
+    if not is_vocabulary:
+        numeric_identifiers = _numeric_values(identifiers)
+        if numeric_identifiers is not None:
+            numeric_field_values = _numeric_values(df[field])
+    if is_vocabulary:
+        # vocabularies hold no synonyms
+        matches = df.isin(identifiers, case_sensitive=True)
+        standardize = False
+    elif numeric_field_values is not None:
+        # numbers have neither casing nor synonyms
+        matches = _numeric_isin(numeric_identifiers, numeric_field_values)
+        msg_casing = ""
+        standardize = False
+    else:
+        # each side is normalized once
+        keys = to_str(index, case_sensitive=True)
+        field_keys = to_str(df[field], case_sensitive=True)
+        # check if index is compliant with exact matches
+        matches = _isin(keys, field_keys)
+        # matches if case sensitive is turned off, lowercasing the case-sensitive
+        # strings equals to_str(..., case_sensitive=False)
+        keys = keys.str.lower()
+        field_keys = field_keys.str.lower()
+        noncs_matches = _isin(keys, field_keys)
+        msg_casing = "inconsistent casing/" if (noncs_matches & ~matches).any() else ""
 
     result = _validate_stats(identifiers=identifiers, matches=matches)
 
@@ -335,13 +674,12 @@ def inspect(
     info_msg = ""
     if standardize and len(result.non_validated) > 0:
         try:
-            synonyms_mapper = map_synonyms(
-                df=df,
+            synonyms_mapper = _synonyms_mapper(
+                df,
                 identifiers=result.non_validated,
+                keys=_first_keys(index, keys, result.non_validated),
                 field=field,
-                return_mapper=True,
-                case_sensitive=False,
-                mute=True,
+                field_keys=field_keys,
             )
             if len(synonyms_mapper) > 0:
                 print_values = ", ".join(
@@ -369,3 +707,72 @@ def inspect(
         return result.df
 
     return result
+
+
+def _isin(values: pd.Index, reference: pd.Series) -> np.ndarray:
+    """Same as `values.isin(reference)`.
+
+    `isin` of Arrow-backed strings converts the reference element-wise in Python,
+    hashing its unique values is much faster for large references. Values are
+    compared as objects, like `isin` does for mismatching dtypes.
+    """
+    import numpy as np
+
+    return (
+        _unique_object_index(reference).get_indexer(np.asarray(values, dtype=object))
+        >= 0
+    )
+
+
+def _first_keys(index: pd.Index, keys: pd.Index, values: list) -> list:
+    """Keys of the first occurrences of values in the index."""
+    first = ~index.duplicated(keep="first")
+    return keys[first][index[first].get_indexer(values)].tolist()
+
+
+def _synonyms_mapper(
+    df: pd.DataFrame,
+    identifiers: list,
+    keys: list,
+    field: str,
+    field_keys: pd.Series,
+) -> dict:
+    """Case-insensitive mapper of non-validated identifiers to field values.
+
+    Same as :func:`~lamin_utils._map_synonyms.map_synonyms` with `return_mapper=True`,
+    but reuses the lowercased identifiers and field values.
+    """
+    import pandas as pd
+
+    _check_fields(df, field=field, synonyms_field="synonyms")
+    # case-insensitive field match, keeps the first occurrence
+    not_null = df[field].notna().to_numpy()
+    field_index = pd.Index(field_keys.to_numpy()[not_null])
+    first = ~field_index.duplicated(keep="first")
+    field_values = df[field].to_numpy()[not_null][first]
+    positions = field_index[first].get_indexer(pd.Index(keys, dtype=object))
+    mapped = [
+        field_values[p] if p >= 0 and isinstance(k, str) else None
+        for k, p in zip(keys, positions.tolist(), strict=False)
+    ]
+    # synonym match for the rest
+    unmapped = [
+        i for i, m in enumerate(mapped) if m is None and isinstance(keys[i], str)
+    ]
+    if len(unmapped) > 0:
+        synonym_matches = _map_synonym_keys(
+            df,
+            [keys[i] for i in unmapped],
+            field=field,
+            case_sensitive=False,
+            synonyms_field="synonyms",
+            sep="|",
+            keep="first",
+        )
+        for i, m in zip(unmapped, synonym_matches, strict=False):
+            mapped[i] = m
+    return {
+        o: m
+        for o, m in zip(identifiers, mapped, strict=False)
+        if m is not None and o != m
+    }
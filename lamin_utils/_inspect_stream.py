@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from ._inspect import (
+    InspectResult,
+    Validator,
+    _check_type_compatibility,
+    _unique_rm_empty,
+    _validate_logging,
+)
+from ._logger import logger
+from ._vocabulary import _DiskVocabulary
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+    import pandas as pd
+
+
+def inspect_stream(
+    chunks: Iterable[Iterable],
+    field_values: Iterable | Validator | _DiskVocabulary,
+    *,
+    case_sensitive: bool = True,
+    max_terms: int = 1_000_000,
+    mute: bool = False,
+    field: str | None = None,
+) -> InspectResult:
+    """Inspect chunks of identifiers without holding all of them in memory.
+
+    Only the distinct non-empty values of each chunk are validated. The validated
+    and non-validated terms are collected across chunks together with the number
+    of identifiers, so memory is bounded by a chunk and the distinct terms.
+
+    Once more than `max_terms` distinct validated or non-validated terms are seen,
+    only the first `max_terms` of them are kept, and their number is estimated
+    with a HyperLogLog sketch (about 1% standard error). The counts of the result
+    are then approximate.
+
+    Synonyms aren't looked up, and accessing the `df` of the result raises a
+    `ValueError`.
+
+    Args:
+        chunks: Iterable of chunks of identifiers, for instance lists, Series, or
+            the columns of `pd.read_csv(..., chunksize=...)`.
+        field_values: The valid values, a :class:`Validator` or an on-disk
+            vocabulary.
+        case_sensitive: If True, the comparison is case-sensitive.
+        max_terms: Maximal number of validated and of non-validated terms to keep.
+        mute: If True, suppresses logging.
+        field: Name of the field being validated, used in logging.
+
+    Returns:
+        InspectResult object.
+
+    Examples:
+        >>> chunks = pd.read_csv("variants.csv", usecols=["id"], chunksize=10**6)
+        >>> result = inspect_stream((c["id"] for c in chunks), variants_vocabulary)
+    """
+    import pandas as pd
+
+    if max_terms < 1:
+        raise ValueError("max_terms must be positive")
+    if not isinstance(field_values, Validator | _DiskVocabulary):
+        field_values = Validator(field_values)
+    validated = _DistinctTerms(max_terms)
+    non_validated = _DistinctTerms(max_terms)
+    n_identifiers = 0
+    for chunk in chunks:
+        if not isinstance(chunk, pd.Series | pd.Index):
+            chunk = list(chunk)
+        n_identifiers += len(chunk)
+        uniques = _unique_rm_empty(pd.Index(chunk))
+        if len(uniques) == 0:
+            continue
+        # iterating Arrow-backed values is slow
+        values = uniques.to_numpy(dtype=object)
+        if isinstance(field_values, _DiskVocabulary):
+            _check_type_compatibility(values, [field_values._sample])
+            matches = field_values.isin(values, case_sensitive=case_sensitive)
+        else:
+            matches = field_values.validate(
+                values, case_sensitive=case_sensitive, mute=True
+            )
+        validated.add(uniques[matches])
+        non_validated.add(uniques[~matches])
+
+    n_unique = len(validated) + len(non_validated)
+    if n_unique == 0:
+        frac_validated = 0
+    else:
+        frac_validated = 100 - round(len(non_validated) / n_unique * 100, 1)
+    result = InspectResult(
+        validated=validated.terms,
+        nonvalidated=non_validated.terms,
+        frac_validated=frac_validated,
+        n_empty=max(n_identifiers - n_unique, 0),
+        n_unique=n_unique,
+    )
+    if not mute:
+        if n_identifiers == 0:
+            logger.warning("input has zero length")
+        else:
+            if validated.is_estimated or non_validated.is_estimated:
+                logger.warning(
+                    f"more than {max_terms} distinct terms, counts are estimated"
+                )
+            _validate_logging(result, field=field)
+    return result
+
+
+class _DistinctTerms:
+    """Distinct terms in order of appearance, sketched above `max_terms`."""
+
+    # 2**14 registers, about 1% standard error
+    _precision = 14
+
+    def __init__(self, max_terms: int) -> None:
+        self._max_terms = max_terms
+        self._terms: dict = {}
+        self._registers: np.ndarray | None = None
+
+    @property
+    def is_estimated(self) -> bool:
+        return self._registers is not None
+
+    @property
+    def terms(self) -> list:
+        return list(self._terms)
+
+    def add(self, values: pd.Index) -> None:
+        import numpy as np
+
+        if len(values) == 0:
+            return
+        if self._registers is not None:
+            self._update(values.to_numpy(dtype=object))
+            return
+        self._terms.update(dict.fromkeys(values.tolist()))
+        if len(self._terms) > self._max_terms:
+            self._registers = np.zeros(2**self._precision, dtype=np.uint8)
+            self._update(np.array(list(self._terms), dtype=object))
+            self._terms = dict.fromkeys(islice(self._terms, self._max_terms))
+
+    def _update(self, values: np.ndarray) -> None:
+        import numpy as np
+        import pandas as pd
+
+        hashes = pd.util.hash_array(values, categorize=False)
+        n_rest = 64 - self._precision
+        buckets = (hashes >> np.uint64(n_rest)).astype(np.intp)
+        rest = hashes & np.uint64((1 << n_rest) - 1)
+        # position of the leftmost 1-bit in the remaining bits, exact in float64
+        bit_lengths = np.frexp(rest.astype(np.float64))[1]
+        ranks = (n_rest - bit_lengths + 1).astype(np.uint8)
+        np.maximum.at(self._registers, buckets, ranks)
+
+    def __len__(self) -> int:
+        import numpy as np
+
+        if self._registers is None:
+            return len(self._terms)
+        m = len(self._registers)
+        estimate = (
+            0.7213
+            / (1 + 1.079 / m)
+            * m**2
+            / np.sum(np.ldexp(1.0, -self._registers.astype(np.int64)))
+        )
+        n_zeros = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * m and n_zeros > 0:
+            # linear counting for small cardinalities
+            estimate = m * np.log(m / n_zeros)
+        return max(round(estimate), len(self._terms))
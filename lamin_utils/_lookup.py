@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import json
 import keyword
-import re
+import pickle
 from collections import namedtuple
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
 from ._logger import logger
@@ -10,6 +12,8 @@ from ._logger import logger
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    import numpy as np
+
 
 def _append_records_to_list(df_dict: dict, value: str, record) -> None:
     """Append unique records to a list."""
@@ -23,34 +27,113 @@ def _append_records_to_list(df_dict: dict, value: str, record) -> None:
         df_dict[value] = values_list
 
 
-def _create_df_dict(
-    df: Any = None,
-    field: str | None = None,
-    records: list | None = None,
-    values: list | None = None,
-    tuple_name: str | None = None,
-) -> dict:
+def _create_df_dict(get_record: Any, uniques: Any, order: Any, starts: Any) -> dict:
     """Create a dict with {lookup key: records in namedtuple}.
 
     Value is a list of namedtuples if multiple records match the same key.
     """
-    if df is not None:
-        records = df.itertuples(index=False, name=tuple_name)
-        values = df[field]
     df_dict: dict = {}  # a dict of namedtuples as records and values as keys
-    for i, row in enumerate(records):  # type:ignore
-        value = values[i]  # type:ignore
-        if not isinstance(value, str):
-            continue
-        if value == "":
-            continue
-        if value in df_dict:
-            _append_records_to_list(df_dict=df_dict, value=value, record=row)
+    for value, start, end in zip(
+        uniques.tolist(), starts[:-1].tolist(), starts[1:].tolist(), strict=True
+    ):
+        if end - start == 1:
+            df_dict[value] = get_record(order[start].item())
         else:
-            df_dict[value] = row
+            df_dict[value] = _unique_records(
+                [get_record(i) for i in order[start:end].tolist()]
+            )
     return df_dict
 
 
+def _record_getter(store: Any, tuple_name: str) -> Any:
+    """Record by row position, namedtuples of DataFrame rows are created on access."""
+    if isinstance(store, list):
+        return store.__getitem__
+    return _row_getter(store, tuple_name)
+
+
+def _unique_records(records: list) -> list:
+    """Unique records in order, same as appending them with `_append_records_to_list`."""
+    try:
+        return list(dict.fromkeys(records))
+    except TypeError:
+        df_dict = {"value": records[0]}
+        for record in records[1:]:
+            _append_records_to_list(df_dict=df_dict, value="value", record=record)
+        return df_dict["value"]
+
+
+def _write_store(path: Path, store: Any) -> str:
+    """Write the record store, returns its format."""
+    if not isinstance(store, list):
+        try:
+            import pyarrow as pa
+
+            table = pa.Table.from_pandas(store, preserve_index=False)
+        except (ImportError, TypeError, ValueError, NotImplementedError):
+            # no pyarrow, or columns that Arrow can't represent
+            table = None
+        # the columns of the loaded DataFrame need to be the same, which isn't the
+        # case for object columns or non-string column names, for instance
+        if table is not None and _same_columns(table.schema.empty_table(), store):
+            with pa.OSFile(str(path / "records.arrow"), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            return "arrow"
+    with (path / "records.pkl").open("wb") as f:
+        pickle.dump(store, f)
+    return "pickle"
+
+
+def _same_columns(table: Any, df: Any) -> bool:
+    empty_df = table.to_pandas()
+    return empty_df.columns.tolist() == df.columns.tolist() and all(
+        empty_df.dtypes == df.dtypes
+    )
+
+
+def _read_store(path: Path, store_format: str) -> Any:
+    if store_format == "arrow":
+        import pyarrow as pa
+
+        # string columns are views of the memory-mapped file
+        source = pa.memory_map(str(path / "records.arrow"))
+        return pa.ipc.open_file(source).read_all().to_pandas()
+    with (path / "records.pkl").open("rb") as f:
+        return pickle.load(f)  # noqa: S301
+
+
+def _row_getter(df: Any, tuple_name: str) -> Any:
+    """Namedtuple of a DataFrame row by position, created on access.
+
+    The records are the same as those of `df.itertuples(index=False, name=tuple_name)`,
+    but only the rows that are accessed are converted.
+    """
+    import numpy as np
+
+    record_type = namedtuple(tuple_name, df.columns, rename=True)  # type:ignore
+    getters = []
+    for k in range(df.shape[1]):
+        column = df.iloc[:, k]
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biufc":
+            # Python scalars like itertuples returns
+            getters.append(_item_getter(column.to_numpy()))
+        else:
+            getters.append(column.array.__getitem__)
+
+    def get(row: int) -> tuple:
+        return tuple.__new__(record_type, [getter(row) for getter in getters])
+
+    return get
+
+
+def _item_getter(values: Any) -> Any:
+    def get(row: int) -> Any:
+        return values[row].item()
+
+    return get
+
+
 class _ListValueWrapper:
     """Wrapper that warns when a list value is accessed and applies keep strategy."""
 
@@ -152,26 +235,133 @@ class Lookup:
         values: Iterable | None = None,
         records: list | None = None,
         keep: Literal["first", "last", False] = "first",
+        lazy: bool = False,
     ) -> None:
         self._tuple_name = tuple_name
+        self._prefix = prefix
+        self._keep = keep
+        self._lazy = lazy
+        # {return_field: lookup object}
+        self._lookups: dict = {}
+        # (attribute names as an Index, lookup keys) of resolve_many()
+        self._key_index: tuple | None = None
         if df is not None:
-            if df.shape[0] > 500000:
-                logger.warning(
-                    "generating lookup object from >500k keys is not recommended and"
-                    " extremely slow"
-                )
             values = df[field]
-        self._df_dict = _create_df_dict(
-            df=df,
-            field=field,
-            records=records,
-            values=values,  # type:ignore
-            tuple_name=self._tuple_name,
+            # the record store, rows are viewed by position
+            self._store = df.copy(deep=False)
+        else:
+            self._store = list(records)  # type:ignore
+        self._get_record = _record_getter(self._store, tuple_name)
+        # row positions grouped by value in one pass instead of appending per row
+        self._uniques, self._order, self._starts = _group_positions(values)  # type:ignore
+        # {lookup_key: value_or_values}, created by the first lookup() if lazy,
+        # records are only created on access in both cases
+        self._lkeys: dict | None = None
+        # {value: record_or_records}, created by the first dict()
+        self._df_dict: dict | None = None
+        if not lazy:
+            self._lookup_keys()
+
+    def _all_records(self) -> Any:
+        """Record getter for all rows, DataFrame rows are converted at once."""
+        if isinstance(self._store, list):
+            return self._get_record
+        # faster than creating the namedtuples one by one
+        records = list(self._store.itertuples(index=False, name=self._tuple_name))
+        return records.__getitem__
+
+    def __getstate__(self) -> dict:
+        # records and lookup objects are instances of classes created at runtime,
+        # they are recreated from the record store and the index
+        state = self.__dict__.copy()
+        for name in ("_get_record", "_df_dict", "_lookups"):
+            state.pop(name, None)
+        state["_lkeys"] = self._lookup_keys()
+        state["_key_index"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._get_record = _record_getter(self._store, self._tuple_name)
+        self._lookups = {}
+        self._df_dict = None
+        if not self._lazy:
+            self._lookup_keys()
+
+    def save(self, path: str | Path) -> Path:
+        """Save the lookup keys, their records and the record store to a directory.
+
+        The row positions are saved as `.npy` files and a DataFrame record store as
+        an Arrow IPC file if `pyarrow` is installed, so :meth:`load` memory-maps
+        them and processes loading the same directory share them in the page cache.
+        Other record stores are pickled.
+
+        Args:
+            path: Directory to write, created if it doesn't exist.
+
+        Returns:
+            The directory.
+
+        Examples:
+            >>> Lookup(df=genes_df, field="symbol").save("genes.lookup")
+            >>> lookup = Lookup.load("genes.lookup").lookup()
+        """
+        import numpy as np
+
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / "order.npy", self._order)
+        np.save(path / "starts.npy", self._starts)
+        with (path / "keys.pkl").open("wb") as f:
+            pickle.dump((self._uniques, self._lookup_keys()), f)
+        store_format = _write_store(path, self._store)
+        meta = {
+            "format": "lookup",
+            "store": store_format,
+            "tuple_name": self._tuple_name,
+            "prefix": self._prefix,
+            "keep": self._keep,
+        }
+        (path / "meta.json").write_text(json.dumps(meta))
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path, *, lazy: bool = True) -> Lookup:
+        """Load a lookup written by :meth:`save`.
+
+        Only load directories from trusted sources, they contain pickled objects.
+
+        Args:
+            path: Directory written by :meth:`save`.
+            lazy: If True, records are created on access.
+        """
+        import numpy as np
+
+        path = Path(path)
+        meta_path = path / "meta.json"
+        if not meta_path.exists():
+            raise FileNotFoundError(f"no lookup found at {path}")
+        meta = json.loads(meta_path.read_text())
+        if meta.get("format") != "lookup":
+            raise ValueError(f"{path} is a '{meta.get('format')}', not a lookup")
+        with (path / "keys.pkl").open("rb") as f:
+            uniques, lkeys = pickle.load(f)  # noqa: S301
+        lookup = cls.__new__(cls)
+        lookup.__setstate__(
+            {
+                "_tuple_name": meta["tuple_name"],
+                "_prefix": meta["prefix"],
+                "_keep": meta["keep"],
+                "_lazy": lazy,
+                "_key_index": None,
+                "_store": _read_store(path, meta["store"]),
+                "_uniques": uniques,
+                "_order": np.load(path / "order.npy", mmap_mode="r"),
+                "_starts": np.load(path / "starts.npy", mmap_mode="r"),
+                "_lkeys": lkeys,
+            }
         )
-        lkeys = self._to_lookup_keys(values=values, prefix=prefix)  # type:ignore
-        self._lookup_dict = self._create_lookup_dict(lkeys=lkeys, df_dict=self._df_dict)
-        self._prefix = prefix
-        self._keep = keep
+        return lookup
 
     def _to_lookup_keys(self, values: Iterable, prefix: str) -> dict:
         """Convert a list of strings to tab-completion allowed formats.
@@ -179,107 +369,412 @@ class Lookup:
         Returns:
             {lookup_key: value_or_values}
         """
-        lkeys: dict = {}
-        for value in list(values):
-            if not isinstance(value, str):
-                continue
-            # replace any special character with _
-            lkey = re.sub("[^0-9a-zA-Z_]+", "_", str(value)).lower()
-            if lkey == "":  # empty strings are skipped
-                continue
-            if not lkey[0].isalpha():  # must start with a letter
-                lkey = f"{prefix.lower()}_{lkey}"
-
-            if lkey in lkeys:
-                # if multiple values have the same lookup key
-                # put the values into a list
-                _append_records_to_list(df_dict=lkeys, value=lkey, record=value)
-            else:
-                lkeys[lkey] = value
-        return lkeys
-
-    def _create_lookup_dict(self, lkeys: dict, df_dict: dict) -> dict:
-        lkey_dict: dict = {}  # a dict of namedtuples as records and lookup keys as keys
-        for lkey, values in lkeys.items():
-            if isinstance(values, list):
-                combined_list = []
-                for v in values:
-                    records = df_dict.get(v)
-                    if isinstance(records, list):
-                        combined_list += records
-                    else:
-                        combined_list.append(records)
-                lkey_dict[lkey] = combined_list
+        import numpy as np
+        import pandas as pd
+
+        values = _as_series(values)
+        values = values[_is_string(values)].astype(str)
+        # replace any special character with _
+        lkeys = values.str.replace("[^0-9a-zA-Z_]+", "_", regex=True).str.lower()
+        is_key = lkeys.ne("").to_numpy(dtype=bool)  # empty strings are skipped
+        values, lkeys = values[is_key], lkeys[is_key]
+        # must start with a letter
+        starts_with_letter = lkeys.str.match("[a-z]").to_numpy(dtype=bool)
+        lkeys = lkeys.where(starts_with_letter, f"{prefix.lower()}_" + lkeys)
+
+        codes, unique_lkeys = pd.factorize(lkeys)
+        value_list = values.tolist()
+        first_positions = np.unique(codes, return_index=True)[1]
+        lkeys_dict = dict(
+            zip(
+                unique_lkeys.tolist(),
+                [value_list[i] for i in first_positions.tolist()],
+                strict=True,
+            )
+        )
+        # if multiple values have the same lookup key
+        # put the unique values into a list
+        is_collision = np.bincount(codes)[codes] > 1
+        if is_collision.any():
+            pairs = pd.DataFrame(
+                {
+                    "code": codes[is_collision],
+                    "value": values.to_numpy(dtype=object)[is_collision],
+                }
+            ).drop_duplicates()
+            for code, collided in pairs.groupby("code", sort=False)["value"]:
+                lkeys_dict[unique_lkeys[code]] = collided.tolist()
+        return lkeys_dict
+
+    def _lookup_keys(self) -> dict:
+        """{lookup_key: value_or_values} of the unique values."""
+        if self._lkeys is None:
+            self._lkeys = self._to_lookup_keys(
+                values=self._uniques, prefix=self._prefix
+            )
+        return self._lkeys
+
+    def _records_of(self, value: str) -> Any:
+        """Records of a value, same as the values of `_create_df_dict`."""
+        code = self._uniques.get_loc(value)
+        positions = self._order[self._starts[code] : self._starts[code + 1]]
+        rows = [self._get_record(i) for i in positions.tolist()]
+        return rows[0] if len(rows) == 1 else _unique_records(rows)
+
+    def _lkey_records(self, lkey: str) -> Any:
+        """Records of a lookup key, those of all values with this lookup key."""
+        values = self._lookup_keys()[lkey]
+        if not isinstance(values, list):
+            return self._records_of(values)
+        combined_list = []
+        for v in values:
+            records = self._records_of(v)
+            if isinstance(records, list):
+                combined_list += records
             else:
-                lkey_dict[lkey] = df_dict.get(values)
-
-        return lkey_dict
+                combined_list.append(records)
+        return combined_list
 
     def dict(self) -> dict:
-        """Dictionary of the lookup."""
+        """Dictionary of the lookup, the records are created on the first call."""
+        if self._df_dict is None:
+            self._df_dict = _create_df_dict(
+                self._all_records(), self._uniques, self._order, self._starts
+            )
         return self._df_dict
 
+    def _lookup_value(
+        self, key: str, value: Any, return_field: str | None
+    ) -> tuple[Any, int]:
+        """Value of a lookup key after keep and return_field are applied.
+
+        Returns:
+            The value and the number of records it was selected from if keep selected
+            one of multiple records, otherwise 0.
+        """
+        if isinstance(value, list) and len(value) > 1:
+            if self._keep is False:
+                # Keep all duplicates and warn lazily on access.
+                return _ListValueWrapper(key, value, self._keep, return_field), 0
+            # Eagerly resolve duplicates for keep="first"/"last" so attribute
+            # values have the selected element type.
+            selected_value = value[0] if self._keep == "first" else value[-1]
+            if return_field is not None and hasattr(selected_value, return_field):
+                return getattr(selected_value, return_field), len(value)
+            return selected_value, len(value)
+        # Handle single values or single-item lists
+        if isinstance(value, list) and len(value) == 1:
+            value = value[0]  # Unwrap single-item lists
+        if return_field is not None and hasattr(value, return_field):
+            return getattr(value, return_field), 0
+        return value, 0
+
+    def _resolve_attribute(self, name: str, lkey: str, return_field: str | None) -> Any:
+        """Value of a lookup attribute, warns if keep selected one of many records."""
+        value, n_records = self._lookup_value(
+            name, self._lkey_records(lkey), return_field
+        )
+        if n_records > 0:
+            logger.warning(
+                f"{n_records} records found for '{name}'. "
+                f"Returning based on keep='{self._keep}'."
+            )
+        return value
+
     def lookup(self, return_field: str | None = None) -> tuple:
-        """Lookup records with dot access."""
-        # Create a copy to avoid modifying the original
-        lookup_dict_copy = self._lookup_dict.copy()
-
-        # Process values, wrapping lists in warning wrapper
-        processed_dict = {}
-        duplicate_counts: dict[str, int] = {}
-        for key, value in lookup_dict_copy.items():
-            # Handle Python keywords by appending an underscore
-            if keyword.iskeyword(key):
-                key = f"{key}_"
-            if isinstance(value, list) and len(value) > 1:
-                if self._keep is False:
-                    # Keep all duplicates and warn lazily on access.
-                    processed_dict[key] = _ListValueWrapper(
-                        key, value, self._keep, return_field
-                    )
-                else:
-                    # Eagerly resolve duplicates for keep="first"/"last" so attribute
-                    # values have the selected element type.
-                    selected_value = value[0] if self._keep == "first" else value[-1]
-                    duplicate_counts[key] = len(value)
-                    if return_field is not None and hasattr(
-                        selected_value, return_field
-                    ):
-                        processed_dict[key] = getattr(selected_value, return_field)
-                    else:
-                        processed_dict[key] = selected_value
-            else:
-                # Handle single values or single-item lists
-                if isinstance(value, list) and len(value) == 1:
-                    value = value[0]  # Unwrap single-item lists
-
-                if return_field is not None and hasattr(value, return_field):
-                    processed_dict[key] = getattr(value, return_field)
-                else:
-                    processed_dict[key] = value
-
-        keys: list = list(processed_dict.keys()) + ["dict"]
-        MyTuple = namedtuple("Lookup", keys)  # type:ignore
-
-        if self._keep is not False and duplicate_counts:
-            # Warn once per duplicated key on first attribute access while keeping
-            # eager value resolution (non-wrapper return types).
-            MyTuple._duplicate_counts = duplicate_counts  # type:ignore[attr-defined]
-            MyTuple._warned_duplicate_keys = set()  # type:ignore[attr-defined]
-            MyTuple._keep = self._keep  # type:ignore[attr-defined]
-
-            def _lookup_getattribute(instance, name):
-                cls = tuple.__getattribute__(instance, "__class__")
-                duplicate_map = cls._duplicate_counts  # type:ignore[attr-defined]
-                warned_keys = cls._warned_duplicate_keys  # type:ignore[attr-defined]
-                if name in duplicate_map and name not in warned_keys:
-                    logger.warning(
-                        f"{duplicate_map[name]} records found for '{name}'. "
-                        f"Returning based on keep='{cls._keep}'."  # type:ignore[attr-defined]
-                    )
-                    warned_keys.add(name)
-                return tuple.__getattribute__(instance, name)
-
-            MyTuple.__getattribute__ = _lookup_getattribute  # type:ignore[method-assign]
-
-        return MyTuple(**processed_dict, dict=self.dict)  # type:ignore
+        """Lookup records with dot access.
+
+        The lookup object is built once per `return_field` and then reused, this
+        assumes that the records aren't modified after the `Lookup` was created.
+        Cached objects aren't invalidated automatically, call :meth:`clear_cache`
+        to build new ones. As the object is reused, the warning about a key with
+        several records is logged on the first access of the key per object, not
+        per call.
+        """
+        if return_field not in self._lookups:
+            self._lookups[return_field] = self._build_lookup(return_field)
+        return self._lookups[return_field]
+
+    def clear_cache(self) -> None:
+        """Drop the lookup objects cached by :meth:`lookup`."""
+        self._lookups = {}
+
+    def resolve_many(
+        self,
+        keys: Iterable,
+        return_field: str | None = None,
+        keep: Literal["first", "last", False] | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Resolve many lookup keys at once.
+
+        The keys are matched against the index of lookup keys in one vectorized
+        call, and the records of each distinct key are selected once.
+
+        Args:
+            keys: Lookup keys, the attribute names of `lookup()`.
+            return_field: Field of the records to return instead of the records.
+            keep: Which of multiple records of a key to return, "first", "last", or
+                False for a list of all of them. Defaults to the `keep` of the Lookup.
+
+        Returns:
+            An object array with the results of the keys, None for missing keys, and
+            a boolean mask of the missing keys.
+
+        Examples:
+            >>> records, missing = lookup.resolve_many(["a1cf", "brca2", "xyz"])
+            >>> missing
+            array([False, False,  True])
+        """
+        import numpy as np
+        import pandas as pd
+
+        keep = self._keep if keep is None else keep
+        if keep not in ("first", "last", False):
+            raise ValueError("keep must be one of 'first', 'last' or False")
+        names, lkeys = self._lookup_key_index()
+        if not isinstance(keys, pd.Series | pd.Index | np.ndarray):
+            keys = list(keys)
+        positions = names.get_indexer(pd.Index(keys, dtype=object))
+        missing = positions < 0
+        results = np.full(len(positions), None, dtype=object)
+        unique_positions, inverse = np.unique(positions[~missing], return_inverse=True)
+        resolved = np.empty(len(unique_positions), dtype=object)
+        n_duplicated = 0
+        for i, position in enumerate(unique_positions.tolist()):
+            resolved[i], n_records = _select_records(
+                self._lkey_records(lkeys[position]), keep, return_field
+            )
+            n_duplicated += n_records > 1
+        if n_duplicated > 0 and keep is not False:
+            logger.warning(
+                f"multiple records found for {n_duplicated} keys, returning based on"
+                f" keep='{keep}'"
+            )
+        results[~missing] = resolved[inverse]
+        return results, missing
+
+    def _lookup_key_index(self) -> tuple[Any, list]:
+        """Index of the attribute names of the lookup keys, and the lookup keys."""
+        if self._key_index is None:
+            import pandas as pd
+
+            lkeys = list(self._lookup_keys())
+            names = [f"{lkey}_" if keyword.iskeyword(lkey) else lkey for lkey in lkeys]
+            self._key_index = (pd.Index(names, dtype=object), lkeys)
+        return self._key_index
+
+    def _build_lookup(self, return_field: str | None) -> tuple:
+        if self._lazy:
+            return _LazyLookup(self, return_field)  # type:ignore
+
+        # Handle Python keywords by appending an underscore
+        names = [
+            f"{lkey}_" if keyword.iskeyword(lkey) else lkey
+            for lkey in self._lookup_keys()
+        ]
+        namespace: dict = {
+            "__slots__": (),
+            "_fields": (*names, "dict"),
+            "_lookup": self,
+            "_return_field": return_field,
+            "_values": {},
+        }
+        # keys that are also names of tuple methods need to take precedence
+        for name in names:
+            if hasattr(_RecordLookup, name):
+                namespace[name] = property(
+                    lambda instance, name=name: instance._value(name)
+                )
+        lookup_type = type("Lookup", (_RecordLookup,), namespace)
+        return lookup_type(lookup_type._fields)
+
+
+def _select_records(
+    value: Any, keep: Literal["first", "last", False], return_field: str | None
+) -> tuple[Any, int]:
+    """Records of a lookup key after keep and return_field are applied.
+
+    Returns:
+        The selection and the number of records it was selected from.
+    """
+    records = value if isinstance(value, list) else [value]
+    if return_field is not None:
+        records = [getattr(record, return_field, record) for record in records]
+    if keep is False:
+        selected = records if len(records) > 1 else records[0]
+    else:
+        selected = records[0] if keep == "first" else records[-1]
+    return selected, len(records)
+
+
+class _RecordLookup(tuple):
+    """Lookup records with dot access and the API of a namedtuple.
+
+    The value of a key, its records or their `return_field`, is resolved on the
+    first access and then reused, so only the records of accessed keys are
+    created. The tuple holds the field names. Subclasses are created by
+    `Lookup.lookup`.
+    """
+
+    __slots__ = ()
+    _fields: tuple[str, ...] = ()
+    _lookup: Lookup
+    _return_field: str | None
+    # {field: value} of the accessed fields
+    _values: dict = {}
+
+    def _value(self, name: str) -> Any:
+        values = type(self)._values
+        if name not in values:
+            lkey = _attribute_lkey(name, self._lookup._lookup_keys())
+            if lkey is None:
+                raise AttributeError(f"'Lookup' object has no attribute '{name}'")
+            values[name] = self._lookup._resolve_attribute(
+                name, lkey, self._return_field
+            )
+        return values[name]
+
+    def __getattr__(self, name: str) -> Any:
+        return self._value(name)
+
+    def __getitem__(self, index):
+        names = tuple.__getitem__(self, index)
+        if isinstance(index, slice):
+            return tuple(self._field_value(name) for name in names)
+        return self._field_value(names)
+
+    def _field_value(self, name: str) -> Any:
+        return self._lookup.dict if name == "dict" else self._value(name)
+
+    def __iter__(self):
+        return (self._field_value(name) for name in tuple.__iter__(self))
+
+    def __contains__(self, value) -> bool:
+        return any(v == value for v in self)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, tuple):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def count(self, value) -> int:
+        return tuple(self).count(value)
+
+    def index(self, value, *args) -> int:
+        return tuple(self).index(value, *args)
+
+    def _asdict(self) -> dict:
+        return dict(zip(self._fields, self, strict=True))
+
+    def __dir__(self) -> list[str]:
+        return list(self._fields) + [
+            name for name in super().__dir__() if name not in self._fields
+        ]
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={value!r}" for name, value in self._asdict().items()
+        )
+        return f"{type(self).__name__}({values})"
+
+    def dict(self) -> dict:
+        """Dictionary of the lookup."""
+        return self._lookup.dict()
+
+
+def _attribute_lkey(name: str, lkeys: dict) -> str | None:
+    """Lookup key of an attribute, Python keywords get an underscore appended."""
+    if name.endswith("_") and keyword.iskeyword(name[:-1]):
+        name = name[:-1]
+    elif keyword.iskeyword(name):
+        return None
+    return name if name in lkeys else None
+
+
+class _LazyLookup:
+    """Lookup records with dot and [] access, created on first access of a key."""
+
+    def __init__(self, lookup: Lookup, return_field: str | None) -> None:
+        self._lookup = lookup
+        self._return_field = return_field
+        self._lkeys = lookup._lookup_keys()
+
+    def __getattr__(self, name: str) -> Any:
+        lkeys = self.__dict__.get("_lkeys")
+        lkey = None if lkeys is None else _attribute_lkey(name, lkeys)
+        if lkey is None:
+            raise AttributeError(f"'Lookup' object has no attribute '{name}'")
+        value = self._lookup._resolve_attribute(name, lkey, self._return_field)
+        # later accesses are plain attribute lookups
+        self.__dict__[name] = value
+        return value
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __dir__(self) -> list[str]:
+        return [
+            f"{lkey}_" if keyword.iskeyword(lkey) else lkey for lkey in self._lkeys
+        ] + ["dict"]
+
+    def __len__(self) -> int:
+        return len(self._lkeys)
+
+    def dict(self) -> dict:
+        """Dictionary of the lookup."""
+        return self._lookup.dict()
+
+
+def _group_positions(values: Iterable) -> tuple[Any, Any, Any]:
+    """Group the row positions of non-empty string values.
+
+    Returns:
+        The unique values in order of appearance as an Index, the row positions
+        ordered by value, and the offsets of each value's positions in them.
+    """
+    import numpy as np
+    import pandas as pd
+
+    values = _as_series(values)
+    is_value = _is_string(values) & values.ne("").to_numpy(dtype=bool, na_value=False)
+    positions = np.flatnonzero(is_value)
+    codes, uniques = pd.factorize(values.iloc[positions])
+    order = positions[np.argsort(codes, kind="stable")]
+    starts = np.zeros(len(uniques) + 1, dtype=np.intp)
+    np.cumsum(np.bincount(codes, minlength=len(uniques)), out=starts[1:])
+    return uniques, order, starts
+
+
+def _as_series(values: Iterable) -> Any:
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(values, pd.Index | np.ndarray):
+        values = pd.Series(values, copy=False)
+    elif not isinstance(values, pd.Series):
+        values = pd.Series(list(values), dtype=object)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(object)
+    return values
+
+
+def _is_string(values: Any) -> Any:
+    """Mask of the values that are strings."""
+    import numpy as np
+    import pandas as pd
+
+    if values.dtype == object:
+        return np.fromiter(
+            (isinstance(v, str) for v in values.to_numpy()),
+            dtype=bool,
+            count=len(values),
+        )
+    if pd.api.types.is_string_dtype(values.dtype):
+        return values.notna().to_numpy(dtype=bool)
+    return np.zeros(len(values), dtype=bool)
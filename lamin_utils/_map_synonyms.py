@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+import math
+import re
+from typing import TYPE_CHECKING, Any, Literal
 
 from ._logger import logger
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
+    import numpy as np
     import pandas as pd
 
+    from ._synonym_store import SynonymStore
+
 
 def map_synonyms(
     df: pd.DataFrame,
@@ -17,12 +22,13 @@ def map_synonyms(
     *,
     case_sensitive: bool = False,
     return_mapper: bool = False,
+    return_positions: bool = False,
     mute: bool = False,
     synonyms_field: str = "synonyms",
     sep: str = "|",
     keep: Literal["first", "last", False] = "first",
     mute_warning: bool = False,
-) -> dict[str, str] | list[str]:
+) -> dict[str, str] | list[str] | np.ndarray:
     """Maps input identifiers against a field with synonym fallback.
 
     Implements a three-tier matching priority:
@@ -30,12 +36,20 @@ def map_synonyms(
     2. Case-insensitive field match (when case_sensitive=False)
     3. Synonym match (with optional case-insensitive matching)
 
+    Identifiers are mapped with a dict-based engine that scans the reference once
+    per call. To map against the same reference repeatedly, use
+    :class:`~lamin_utils._standardize.Standardizer` or :func:`map_synonyms_chunks`.
+
     Args:
         df: Reference DataFrame.
         identifiers: Identifiers that will be mapped against a field.
         field: The field representing the identifiers.
         case_sensitive: Whether the mapping is case sensitive.
         return_mapper: If True, returns {input : standardized field name}.
+        return_positions: If True, returns the row position in `df` of the mapped
+            field value of each identifier, -1 if unmapped. Any column of `df` can
+            then be gathered directly, e.g. `df["ontology_id"].to_numpy()[positions]`.
+            A field value that occurs in multiple rows is resolved by `keep`.
         mute: If True, suppresses logging of mapping statistics.
         synonyms_field: The field representing the concatenated synonyms.
         sep: Separator used to split synonyms.
@@ -51,22 +65,302 @@ def map_synonyms(
         - If return_mapper is False: a list of mapped field values in input order.
         - If return_mapper is True: a dictionary mapping input identifiers to
           standardized field values (only includes entries that were mapped).
+        - If return_positions is True: an integer array of row positions in
+          input order.
     """
-    import pandas as pd
+    import numpy as np
 
+    if return_positions:
+        _check_positions_args(return_mapper=return_mapper, keep=keep)
     identifiers = list(identifiers)
     n_input = len(identifiers)
 
     # Handle empty inputs
-    if (
-        df.shape[0] == 0
-        or n_input == 0
-        or synonyms_field is None
-        or synonyms_field == "None"
-    ):
+    if df.shape[0] == 0 or n_input == 0:
+        if return_positions:
+            return np.full(n_input, -1, dtype=np.intp)
         return {} if return_mapper else identifiers
+    if synonyms_field is None or synonyms_field == "None":
+        if return_positions:
+            # identifiers are only matched exactly
+            field_column = _column_to_list(df[field])
+            return _row_positions(field_column, identifiers, keep=keep)  # type: ignore
+        return {} if return_mapper else identifiers
+
+    mapped = _map_values(
+        df=df,
+        identifiers=identifiers,
+        field=field,
+        case_sensitive=case_sensitive,
+        synonyms_field=synonyms_field,
+        sep=sep,
+        keep=keep,
+        return_positions=return_positions,
+    )
+    if return_positions:
+        mapped, positions = mapped
+
+    # Log mapping statistics (only count actual changes, not exact matches)
+    n_mapped = _count_changed(identifiers, mapped)
+    if n_mapped > 0 and not mute:
+        s = "" if n_mapped == 1 else "s"
+        logger.info(f"standardized {n_mapped}/{n_input} term{s}")
+
+    # Return results
+    if return_positions:
+        return positions
+    if return_mapper:
+        return _build_mapper(identifiers, mapped, keep, mute_warning)
+    else:
+        return _build_result_list(identifiers, mapped, keep, mute_warning)
+
+
+def map_synonyms_chunks(
+    df: pd.DataFrame,
+    chunks: Iterable[Iterable],
+    field: str,
+    *,
+    case_sensitive: bool = False,
+    mute: bool = False,
+    synonyms_field: str = "synonyms",
+    sep: str = "|",
+    keep: Literal["first", "last", False] = "first",
+    mute_warning: bool = False,
+) -> Iterator[list]:
+    """Maps chunks of identifiers against a field with synonym fallback.
+
+    Streaming variant of :func:`map_synonyms` for inputs that don't fit in memory,
+    e.g. a column read from disk in batches. The reference lookup is compiled once
+    and reused for all chunks, mapping statistics are logged once after the last
+    chunk was consumed.
+
+    Args:
+        df: Reference DataFrame.
+        chunks: An iterable of identifier chunks, e.g. a generator of lists.
+        field: The field representing the identifiers.
+        case_sensitive: Whether the mapping is case sensitive.
+        mute: If True, suppresses logging of mapping statistics.
+        synonyms_field: The field representing the concatenated synonyms.
+        sep: Separator used to split synonyms.
+        keep: {'first', 'last', False}, default 'first'
+            When a synonym maps to multiple standardized values, determines
+            which duplicates to mark as `pandas.DataFrame.duplicated`.
+        mute_warning: If True, suppresses warnings about list values when keep=False.
+
+    Yields:
+        A list of mapped field values per chunk, in input order.
+
+    Examples:
+        >>> chunks = (batch for batch in pd.read_csv(path, chunksize=10**6)["gene"])
+        >>> for mapped in map_synonyms_chunks(genes_df, chunks, field="symbol"):
+        ...     write(mapped)
+    """
+    if df.shape[0] == 0 or synonyms_field is None or synonyms_field == "None":
+        for chunk in chunks:
+            yield list(chunk)
+        return
+
+    lookup = _SynonymLookup(
+        df=df,
+        field=field,
+        case_sensitive=case_sensitive,
+        synonyms_field=synonyms_field,
+        sep=sep,
+        keep=keep,
+    )
+    if keep is False and not mute_warning:
+        logger.warning("returning list might contain lists when 'keep=False'")
+
+    n_input = 0
+    n_mapped = 0
+    for chunk in chunks:
+        identifiers = list(chunk)
+        if len(identifiers) == 0:
+            yield identifiers
+            continue
+        mapped = lookup.map(identifiers)
+        n_input += len(identifiers)
+        n_mapped += _count_changed(identifiers, mapped)
+        yield _build_result_list(identifiers, mapped, keep, mute_warning=True)
+
+    if n_mapped > 0 and not mute:
+        s = "" if n_mapped == 1 else "s"
+        logger.info(f"standardized {n_mapped}/{n_input} term{s}")
+
 
-    # Validate inputs
+class _SynonymLookup:
+    """Reference-side lookup tables of :func:`map_synonyms`.
+
+    Tables are built on first access and reused across calls of :meth:`map`.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        field: str,
+        *,
+        case_sensitive: bool = False,
+        synonyms_field: str = "synonyms",
+        sep: str = "|",
+        keep: Literal["first", "last", False] = "first",
+    ) -> None:
+        _check_fields(df, field=field, synonyms_field=synonyms_field)
+        self._df = df
+        self._field = field
+        self._case_sensitive = case_sensitive
+        self._synonyms_field = synonyms_field
+        self._sep = sep
+        self._keep = keep
+        self._field_values: set | None = None
+        self._field_map: dict | None = None
+        self._synonym_store: SynonymStore | None = None
+
+    @property
+    def field_values(self) -> set:
+        """Field values for exact case-sensitive matching."""
+        if self._field_values is None:
+            self._field_values = set(self._df[self._field].dropna().drop_duplicates())
+        return self._field_values
+
+    @property
+    def field_map(self) -> dict:
+        """Case-insensitive field map {lowercased value: first field value}."""
+        if self._field_map is None:
+            df_field = self._df[[self._field]].dropna(subset=[self._field])
+            df_field["__lookup__"] = to_str(df_field[self._field], case_sensitive=False)
+            df_field = df_field.drop_duplicates(subset=["__lookup__"], keep="first")
+            self._field_map = df_field.set_index("__lookup__")[self._field].to_dict()
+        return self._field_map
+
+    @property
+    def synonym_store(self) -> SynonymStore:
+        """Compact store of synonym → field value links."""
+        if self._synonym_store is None:
+            from ._synonym_store import SynonymStore
+
+            self._synonym_store = SynonymStore.from_df(
+                self._df,
+                field=self._field,
+                synonyms_field=self._synonyms_field,
+                sep=self._sep,
+            )
+        return self._synonym_store
+
+    def compile(self) -> _SynonymLookup:
+        """Build all lookup tables upfront, afterwards the lookup is read-only."""
+        _ = self.field_values
+        if not self._case_sensitive:
+            _ = self.field_map
+        _ = self.synonym_store
+        return self
+
+    def map(self, identifiers: list) -> list:
+        """Map identifiers, returns mapped values with None for unmapped ones."""
+        import pandas as pd
+
+        # Initialize mapping dataframe
+        mapped_df = pd.DataFrame({"orig_ids": identifiers})
+        mapped_df["__lookup__"] = to_str(
+            mapped_df["orig_ids"], case_sensitive=self._case_sensitive
+        )
+        mapped_df["mapped"] = pd.NA
+
+        # Step 1: Try exact case-sensitive match (highest priority)
+        # This preserves original casing even when case_sensitive=False
+        exact_matches = mapped_df["orig_ids"].isin(self.field_values)
+        mapped_df.loc[exact_matches, "mapped"] = mapped_df.loc[
+            exact_matches, "orig_ids"
+        ]
+
+        # Step 2: For case-insensitive mode, try case-insensitive field matching
+        if not self._case_sensitive:
+            unmapped_mask = mapped_df["mapped"].isna()
+            if unmapped_mask.any():
+                mapped_df.loc[unmapped_mask, "mapped"] = mapped_df.loc[
+                    unmapped_mask, "__lookup__"
+                ].map(self.field_map)
+
+        # Step 3: For still-unmapped terms, check synonyms
+        unmapped_mask = mapped_df["mapped"].isna()
+        if unmapped_mask.any() and len(self.synonym_store) > 0:
+            synonym_matches = self.synonym_store.map(
+                mapped_df.loc[unmapped_mask, "__lookup__"].tolist(),
+                case_sensitive=self._case_sensitive,
+                keep=self._keep,
+            )
+            mapped_df.loc[unmapped_mask, "mapped"] = pd.Series(
+                synonym_matches, index=mapped_df.index[unmapped_mask], dtype=object
+            )
+
+        return [
+            m if isinstance(m, list) or not pd.isna(m) else None
+            for m in mapped_df["mapped"]
+        ]
+
+
+def _map_values(
+    df: pd.DataFrame,
+    identifiers: list,
+    field: str,
+    *,
+    case_sensitive: bool,
+    synonyms_field: str,
+    sep: str,
+    keep: Literal["first", "last", False],
+    return_positions: bool = False,
+) -> list | tuple[list, np.ndarray]:
+    """Mapped values with None for unmapped identifiers.
+
+    With `return_positions`, also the row positions of the mapped values.
+    """
+    _check_fields(df, field=field, synonyms_field=synonyms_field)
+    field_column = _column_to_list(df[field])
+    # a single call doesn't amortize the pandas lookup tables: on a 60k-row
+    # reference, 1k identifiers take 0.08s instead of 1.2s, 2M take 6.3s
+    # instead of 15.1s
+    mapped = _map_identifiers_py(
+        df=df,
+        identifiers=identifiers,
+        field=field,
+        case_sensitive=case_sensitive,
+        synonyms_field=synonyms_field,
+        sep=sep,
+        keep=keep,
+        field_column=field_column,
+    )
+    if return_positions:
+        return mapped, _row_positions(field_column, mapped, keep=keep)  # type: ignore
+    return mapped
+
+
+def _check_positions_args(return_mapper: bool, keep: Any) -> None:
+    if return_mapper:
+        raise ValueError("return_positions can't be combined with return_mapper")
+    if keep not in ("first", "last"):
+        raise ValueError(
+            f"Invalid value for keep: {keep}, must be 'first' or 'last' with"
+            " return_positions"
+        )
+
+
+def _row_positions(
+    field_column: list, mapped: list, keep: Literal["first", "last"]
+) -> np.ndarray:
+    """Row positions of the mapped field values, -1 for None."""
+    import numpy as np
+
+    rows: dict = {}
+    for i, value in enumerate(field_column):
+        if not _is_null(value) and (keep == "last" or value not in rows):
+            rows[value] = i
+    return np.fromiter(
+        (-1 if m is None else rows.get(m, -1) for m in mapped),
+        dtype=np.intp,
+        count=len(mapped),
+    )
+
+
+def _check_fields(df: pd.DataFrame, field: str, synonyms_field: str) -> None:
     if field not in df.columns:
         raise KeyError(
             f"field '{field}' is invalid! Available fields are: {list(df.columns)}"
@@ -78,120 +372,244 @@ def map_synonyms(
     if field == synonyms_field:
         raise KeyError("synonyms_field must be different from field!")
 
-    # Track None positions before pandas converts them to NaN (pandas 3.0 + PyArrow)
-    _none_positions = [i for i, v in enumerate(identifiers) if v is None]
 
-    # Initialize mapping dataframe
-    mapped_df = pd.DataFrame({"orig_ids": identifiers})
-    mapped_df["__lookup__"] = to_str(
-        mapped_df["orig_ids"], case_sensitive=case_sensitive
-    )
-    mapped_df["mapped"] = pd.NA
+def _is_null(value: Any) -> bool:
+    """None, NaN or pandas missing value, without importing pandas."""
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return math.isnan(value)
+    return type(value).__name__ in ("NAType", "NaTType")
 
-    # Step 1: Try exact case-sensitive match (highest priority)
-    # This preserves original casing even when case_sensitive=False
-    exact_field_values = set(df[field].dropna().drop_duplicates())
-    exact_matches = mapped_df["orig_ids"].isin(exact_field_values)
-    mapped_df.loc[exact_matches, "mapped"] = mapped_df.loc[exact_matches, "orig_ids"]
 
-    # Step 2: For case-insensitive mode, try case-insensitive field matching
-    if not case_sensitive:
-        unmapped_mask = mapped_df["mapped"].isna()
-        if unmapped_mask.any():
-            # Build case-insensitive field map (keeps first occurrence)
-            df_field = df[[field]].dropna(subset=[field])
-            df_field["__lookup__"] = to_str(df_field[field], case_sensitive=False)
-            df_field = df_field.drop_duplicates(subset=["__lookup__"], keep="first")
-            field_map_lower = df_field.set_index("__lookup__")[field].to_dict()
+def _column_to_list(values: Any) -> list:
+    # iterating Arrow-backed columns element-wise is slow
+    return values.tolist() if hasattr(values, "tolist") else list(values)
 
-            # Apply case-insensitive field map to unmapped entries
-            mapped_df.loc[unmapped_mask, "mapped"] = mapped_df.loc[
-                unmapped_mask, "__lookup__"
-            ].map(field_map_lower)
 
-    # Step 3: For still-unmapped terms, check synonyms
-    unmapped_mask = mapped_df["mapped"].isna()
-    if unmapped_mask.any():
-        unmapped_terms = set(mapped_df.loc[unmapped_mask, "__lookup__"])
+def _lookup_keys(values: list, case_sensitive: bool) -> list:
+    """Equivalent of :func:`to_str` for a list of values.
 
-        syn_map = _build_synonym_map(
-            df=df,
-            synonyms_field=synonyms_field,
+    Missing values become "", strings are lowercased with :func:`_lower_strings` if
+    not `case_sensitive` and other values become None.
+    """
+    keys = ["" if _is_null(v) else v for v in values]
+    if case_sensitive:
+        return keys
+    positions = [i for i, k in enumerate(keys) if isinstance(k, str)]
+    folded: list = [None] * len(keys)
+    for i, k in zip(
+        positions, _lower_strings([keys[i] for i in positions]), strict=True
+    ):
+        folded[i] = k
+    return folded
+
+
+def _lower_strings(strings: list) -> list:
+    """Lowercase strings with the kernel :func:`to_str` uses for string columns.
+
+    This is Arrow's `utf8_lower` for pandas' default string dtype, which differs
+    from `str.lower` for instance for a final sigma or a dotted capital I.
+    """
+    import pandas as pd
+
+    if len(strings) == 0:
+        return []
+    return pd.Series(strings, dtype="str").str.lower().tolist()
+
+
+def _map_identifiers_py(
+    df: pd.DataFrame,
+    identifiers: list,
+    field: str,
+    *,
+    case_sensitive: bool,
+    synonyms_field: str,
+    sep: str,
+    keep: Literal["first", "last", False],
+    field_column: list | None = None,
+) -> list:
+    """Dict-based mapping engine with the same semantics as :class:`_SynonymLookup`.
+
+    Only builds lookup entries for the keys that are actually queried. Doesn't use
+    pandas operations.
+    """
+    if field_column is None:
+        field_column = _column_to_list(df[field])
+    field_values = [v for v in field_column if not _is_null(v)]
+
+    # Step 1: exact case-sensitive match
+    exact = set(field_values)
+    mapped: list = [v if not _is_null(v) and v in exact else None for v in identifiers]
+    unmapped = [i for i, m in enumerate(mapped) if m is None]
+    keys: list = [None] * len(identifiers)
+    for i, k in zip(
+        unmapped,
+        _lookup_keys([identifiers[i] for i in unmapped], case_sensitive),
+        strict=True,
+    ):
+        keys[i] = k
+
+    # Step 2: case-insensitive field match, keeps the first occurrence
+    if not case_sensitive:
+        needed = {k for k in keys if k is not None}
+        if needed:
+            field_strings = [v for v in field_values if isinstance(v, str)]
+            field_map: dict = {}
+            for v, k in zip(field_strings, _lower_strings(field_strings), strict=True):
+                if k in needed and k not in field_map:
+                    field_map[k] = v
+            for i, k in enumerate(keys):
+                if k in field_map:
+                    mapped[i] = field_map[k]
+                    keys[i] = None
+
+    # Step 3: synonym match
+    needed = {k for k in keys if k is not None}
+    if needed:
+        syn_map = _synonym_map_py(
+            df,
+            needed,
             field=field,
-            unmapped_terms=unmapped_terms,
             case_sensitive=case_sensitive,
-            keep=keep,
+            synonyms_field=synonyms_field,
             sep=sep,
+            keep=keep,
+            field_column=field_column,
         )
+        for i, k in enumerate(keys):
+            if k is not None and syn_map.get(k) is not None:
+                mapped[i] = syn_map[k]
 
-        if syn_map:
-            mapped_df.loc[unmapped_mask, "mapped"] = mapped_df.loc[
-                unmapped_mask, "__lookup__"
-            ].map(syn_map)
+    return mapped
 
-    # Log mapping statistics (only count actual changes, not exact matches)
-    if keep is False:
-        changed_mask = (~mapped_df["mapped"].isna()) & (
-            mapped_df.apply(lambda row: row["mapped"] != row["orig_ids"], axis=1)
-        )
-    else:
-        changed_mask = (~mapped_df["mapped"].isna()) & (
-            mapped_df["mapped"] != mapped_df["orig_ids"]
+
+def _synonym_map_py(
+    df: pd.DataFrame,
+    needed: set,
+    field: str,
+    *,
+    case_sensitive: bool,
+    synonyms_field: str,
+    sep: str,
+    keep: Literal["first", "last", False],
+    field_column: list | None = None,
+) -> dict:
+    """Synonym map {lookup key: field value(s)} of the needed lookup keys.
+
+    Mirrors :func:`explode_aggregated_column_to_map` without exploding the whole
+    synonyms column.
+    """
+    if field_column is None:
+        field_column = _column_to_list(df[field])
+    rows = [
+        (target, agg)
+        for target, agg in zip(
+            field_column, _column_to_list(df[synonyms_field]), strict=False
         )
-    n_mapped = changed_mask.sum()
-    if n_mapped > 0 and not mute:
-        s = "" if n_mapped == 1 else "s"
-        logger.info(f"standardized {n_mapped}/{n_input} term{s}")
+        if isinstance(agg, str) and agg != ""
+    ]
 
-    # Return results
-    if return_mapper:
-        return _build_mapper(mapped_df, keep, mute_warning)
+    def split(agg: str) -> list:
+        # pandas treats separators longer than one character as regex
+        return agg.split(sep) if len(sep) == 1 else re.split(sep, agg)
+
+    if case_sensitive:
+        folded_rows = (split(agg) for _, agg in rows)
+    elif len(sep) == 1 and sep.isascii() and not sep.isalpha():
+        # lowercasing can't create or remove such a separator, so the lowercased
+        # strings are split instead of lowercasing each synonym
+        folded_rows = (
+            agg.split(sep) for agg in _lower_strings([agg for _, agg in rows])
+        )
     else:
-        result = _build_result_list(mapped_df, keep, mute_warning)
-        # Restore None for originally-None inputs (pandas 3.0 PyArrow coerces None → NaN)
-        for i in _none_positions:
-            result[i] = None
-        return result
+        synonym_rows = [split(agg) for _, agg in rows]
+        folded_synonyms = iter(
+            _lower_strings([x for synonyms in synonym_rows for x in synonyms])
+        )
+        folded_rows = (
+            [next(folded_synonyms) for _ in synonyms] for synonyms in synonym_rows
+        )
+    seen_pairs: set = set()
+    groups: dict = {}
+    folded_keys: dict = {}
+    for (target, agg), folded in zip(rows, folded_rows, strict=True):
+        if needed.isdisjoint(folded):
+            continue
+        target = None if _is_null(target) else target
+        if (target, agg) in seen_pairs:
+            continue
+        seen_pairs.add((target, agg))
+        for synonym, k in zip(split(agg), folded, strict=True):
+            if synonym == target:
+                continue
+            if k in needed:
+                groups.setdefault(synonym, []).append(target)
+                folded_keys[synonym] = k
+    syn_map: dict = {}
+    # groupby sorts synonyms, case-folded duplicates keep the first of those
+    for synonym in sorted(groups):
+        k = folded_keys[synonym]
+        if k in syn_map:
+            continue
+        targets = groups[synonym]
+        if keep is False:
+            # missing targets are NaN in the grouped lists
+            syn_map[k] = [math.nan if t is None else t for t in targets]
+            continue
+        non_null = [t for t in targets if t is not None]
+        if keep == "first":
+            syn_map[k] = non_null[0] if non_null else None
+        elif keep == "last":
+            syn_map[k] = non_null[-1] if non_null else None
+        else:
+            raise ValueError(f"Invalid value for keep: {keep}")
+    return syn_map
 
 
-def _build_synonym_map(
+def _map_synonym_keys(
     df: pd.DataFrame,
-    synonyms_field: str,
+    keys: list,
     field: str,
-    unmapped_terms: set,
+    *,
     case_sensitive: bool,
-    keep: Literal["first", "last", False],
+    synonyms_field: str,
     sep: str,
-) -> dict:
-    """Build a synonym mapping dictionary for unmapped terms."""
-    syn_series = explode_aggregated_column_to_map(
-        df=df,
-        agg_col=synonyms_field,
-        target_col=field,
-        keep=keep,
+    keep: Literal["first", "last", False],
+) -> list:
+    """Field values of synonym lookup keys, None if not a synonym."""
+    syn_map = _synonym_map_py(
+        df,
+        {k for k in keys if k is not None},
+        field=field,
+        case_sensitive=case_sensitive,
+        synonyms_field=synonyms_field,
         sep=sep,
+        keep=keep,
     )
+    return [syn_map.get(k) for k in keys]
 
-    if not case_sensitive:
-        # Convert synonym keys to lowercase for matching
-        syn_series.index = syn_series.index.str.lower()
-        # Remove duplicate synonym keys (keep first occurrence)
-        syn_series = syn_series[~syn_series.index.duplicated(keep="first")]
 
-    # Only keep synonym mappings for unmapped terms
-    return {k: v for k, v in syn_series.to_dict().items() if k in unmapped_terms}
+def _count_changed(identifiers: list, mapped: list) -> int:
+    """Number of identifiers whose mapped value differs from the input."""
+    return sum(
+        1 for o, m in zip(identifiers, mapped, strict=False) if m is not None and m != o
+    )
 
 
 def _build_mapper(
-    mapped_df: pd.DataFrame,
+    identifiers: list,
+    mapped: list,
     keep: Literal["first", "last", False],
     mute_warning: bool,
 ) -> dict:
-    """Build the mapper dictionary from mapped dataframe."""
-    mapper_df = mapped_df[~mapped_df["mapped"].isna()].copy()
-    mapper = dict(zip(mapper_df["orig_ids"], mapper_df["mapped"], strict=False))
+    """Build the mapper dictionary from mapped values."""
     # Only include entries where mapping changed the value
-    mapper = {k: v for k, v in mapper.items() if k != v}
+    mapper = {
+        o: m
+        for o, m in zip(identifiers, mapped, strict=False)
+        if m is not None and o != m
+    }
 
     if keep is False:
         if not mute_warning:
@@ -206,16 +624,15 @@ def _build_mapper(
 
 
 def _build_result_list(
-    mapped_df: pd.DataFrame,
+    identifiers: list,
+    mapped: list,
     keep: Literal["first", "last", False],
     mute_warning: bool,
 ) -> list:
-    """Build the result list from mapped dataframe."""
-    import pandas as pd
-
+    """Build the result list from mapped values, unmapped ones are kept as is."""
     result = [
-        m if not (m is None or (not isinstance(m, list) and pd.isna(m))) else o
-        for m, o in zip(mapped_df["mapped"], mapped_df["orig_ids"], strict=False)
+        o if m is None or o is None else m
+        for o, m in zip(identifiers, mapped, strict=False)
     ]
 
     if keep is False:
@@ -229,24 +646,74 @@ def to_str(
     series_values: pd.Series | pd.Index | pd.Categorical,
     case_sensitive: bool = False,
 ) -> pd.Series:
-    """Convert Pandas Series values to strings with case sensitive option."""
+    """Convert Pandas Series values to strings with case sensitive option.
+
+    Arrow-backed strings stay in Arrow buffers and are normalized with Arrow
+    kernels. Categoricals are normalized on their categories. Nothing is cached,
+    references that are validated or mapped repeatedly are normalized once by
+    :class:`~lamin_utils._inspect.Validator` and
+    :class:`~lamin_utils._standardize.Standardizer`.
+    """
+    import pandas as pd
+
     if series_values.dtype.name == "category":
-        try:
-            categorical = series_values.cat
-        except AttributeError:
-            categorical = series_values
-        if "" not in categorical.categories:
-            values = categorical.add_categories("")
-        else:
-            values = series_values
-        values = values.infer_objects().fillna("").astype(str)
-    else:
-        values = series_values.infer_objects().fillna("")
+        categorical = (
+            series_values
+            if isinstance(series_values, pd.Categorical)
+            else series_values.array
+        )
+        categories = categorical.categories.astype(str)
+        if case_sensitive is False:
+            categories = categories.str.lower()
+        values = categories.array.take(
+            categorical.codes, allow_fill=True, fill_value=""
+        )
+        return _wrap_like(series_values, values)
+    values = _to_str_arrow(series_values, case_sensitive=case_sensitive)
+    if values is not None:
+        return values
+    values = series_values.infer_objects().fillna("")
     if case_sensitive is False:
         values = values.str.lower()
     return values
 
 
+def _to_str_arrow(
+    series_values: pd.Series | pd.Index, case_sensitive: bool
+) -> pd.Series | pd.Index | None:
+    """:func:`to_str` for Arrow-backed strings, None for other data."""
+    array = getattr(series_values, "array", None)
+    chunked = getattr(array, "_pa_array", None)
+    if chunked is None:
+        return None
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pandas.arrays import ArrowStringArray
+
+    if not (pa.types.is_string(chunked.type) or pa.types.is_large_string(chunked.type)):
+        return None
+    normalized = pc.fill_null(chunked, pa.scalar("", type=chunked.type))
+    if case_sensitive is False:
+        normalized = pc.utf8_lower(normalized)
+    if isinstance(array, ArrowStringArray):
+        values = type(array)(normalized, dtype=array.dtype)
+    else:
+        values = type(array)(normalized)
+    return _wrap_like(series_values, values)
+
+
+def _wrap_like(series_values, values) -> pd.Series | pd.Index:
+    import pandas as pd
+
+    if isinstance(series_values, pd.Series):
+        return pd.Series(
+            values, index=series_values.index, name=series_values.name, copy=False
+        )
+    if isinstance(series_values, pd.Index):
+        return pd.Index(values, name=series_values.name, copy=False)
+    return values
+
+
 def not_empty_none_na(values: Iterable) -> pd.Series:
     """Return values that are not empty string, None or NA."""
     import pandas as pd
@@ -278,15 +745,7 @@ def explode_aggregated_column_to_map(
     Returns:
         A pandas.Series indexed by the split values from the aggregated column
     """
-    df = df[[target_col, agg_col]].drop_duplicates().dropna(subset=[agg_col])
-
-    # subset to df with only non-empty strings in the agg_col
-    df = df.loc[not_empty_none_na(df[agg_col]).index]
-
-    df[agg_col] = df[agg_col].str.split(sep)
-    df_explode = df.explode(agg_col)
-    # remove rows with same values in agg_col and target_col
-    df_explode = df_explode[df_explode[agg_col] != df_explode[target_col]]
+    df_explode = _explode_synonyms(df, agg_col=agg_col, target_col=target_col, sep=sep)
 
     # group by the agg_col and return based on keep for the target_col values
     gb = df_explode.groupby(agg_col)[target_col]
@@ -298,3 +757,18 @@ def explode_aggregated_column_to_map(
         return gb.apply(list)
     else:
         raise ValueError(f"Invalid value for keep: {keep}")
+
+
+def _explode_synonyms(df, agg_col: str, target_col: str, sep: str) -> pd.DataFrame:
+    """One row per (target value, split value) link, in row order."""
+    df = df[[target_col, agg_col]].drop_duplicates().dropna(subset=[agg_col])
+
+    # subset to df with only non-empty strings in the agg_col
+    df = df.loc[not_empty_none_na(df[agg_col]).index]
+
+    df[agg_col] = df[agg_col].str.split(sep)
+    df_explode = df.explode(agg_col)
+    # non-string aggregated values split to NaN, groupby drops them as well
+    df_explode = df_explode.dropna(subset=[agg_col])
+    # remove rows with same values in agg_col and target_col
+    return df_explode[df_explode[agg_col] != df_explode[target_col]]
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 from typing import TYPE_CHECKING, Any, Literal
 
 from ._logger import logger
-from ._map_synonyms import map_synonyms
+from ._map_synonyms import (
+    _build_mapper,
+    _build_result_list,
+    _column_to_list,
+    _count_changed,
+    _map_values,
+    _SynonymLookup,
+    map_synonyms,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    import numpy as np
+    import pandas as pd
+
 
 def standardize(
     df: Any,
@@ -18,11 +32,12 @@ def standardize(
     return_field: str = None,
     case_sensitive: bool = False,
     return_mapper: bool = False,
+    return_positions: bool = False,
     mute: bool = False,
     synonyms_field: str = "synonyms",
     sep: str = "|",
     keep: Literal["first", "last", False] = "first",
-) -> dict[str, str] | list[str]:
+) -> dict[str, str] | list[str] | np.ndarray:
     """Standardizes input identifiers against a concatenated synonyms column.
 
     Will also standardize casing.
@@ -34,6 +49,9 @@ def standardize(
         return_field: The field to return. Defaults to field.
         case_sensitive: Whether the mapping is case sensitive.
         return_mapper: If True, returns {input synonyms : standardized field name}.
+        return_positions: If True, returns the row positions in `df` instead of
+            values, see :func:`~lamin_utils._map_synonyms.map_synonyms`. Any
+            `return_field` can be gathered from them.
         mute: If True, suppresses logging.
         synonyms_field: The field representing the concatenated synonyms.
         sep: Which separator is used to separate synonyms.
@@ -48,7 +66,22 @@ def standardize(
         - If return_mapper is False: a list of mapped field values.
         - If return_mapper is True: a dictionary of mapped values with mappable
             identifiers as keys and values mapped to field as values.
+        - If return_positions is True: an integer array of row positions, -1 for
+            unmapped identifiers.
     """
+    if return_positions:
+        return map_synonyms(
+            df=df,
+            identifiers=identifiers,
+            field=field,
+            return_mapper=return_mapper,
+            return_positions=True,
+            case_sensitive=case_sensitive,
+            mute=mute,
+            synonyms_field=synonyms_field,
+            sep=sep,
+            keep=keep,
+        )
     if df.shape[0] == 0 or len(identifiers) == 0:  # type: ignore
         if return_mapper:
             return {}
@@ -58,92 +91,413 @@ def standardize(
     # default return_field to field if not specified
     return_field = field if return_field is None else return_field
 
-    # map synonyms
-    result = map_synonyms(
-        df=df,
-        identifiers=identifiers,
-        field=field,
-        return_mapper=return_mapper,
-        case_sensitive=case_sensitive,
-        mute=mute,
-        synonyms_field=synonyms_field,
-        sep=sep,
-        keep=keep,
-    )
-
     if return_field == field:
-        return result
-
-    # convert identifiers to return_field
-    # always get the full list of values (identifiers)
-    if return_mapper:
-        values = map_synonyms(
+        return map_synonyms(
             df=df,
             identifiers=identifiers,
             field=field,
-            return_mapper=False,
+            return_mapper=return_mapper,
             case_sensitive=case_sensitive,
-            mute=True,
+            mute=mute,
             synonyms_field=synonyms_field,
             sep=sep,
             keep=keep,
-            mute_warning=True,
         )
+
+    # resolve identifiers once, then convert to return_field
+    identifiers = list(identifiers)
+    if synonyms_field is None or synonyms_field == "None":
+        mapped: list = [None] * len(identifiers)
     else:
-        values = result
+        mapped = _map_values(
+            df=df,
+            identifiers=identifiers,
+            field=field,
+            case_sensitive=case_sensitive,
+            synonyms_field=synonyms_field,
+            sep=sep,
+            keep=keep,
+        )
+    n_mapped = _count_changed(identifiers, mapped)
+    if n_mapped > 0 and not mute:
+        s = "" if n_mapped == 1 else "s"
+        logger.info(f"standardized {n_mapped}/{len(identifiers)} term{s}")
 
-    # no values can be converted
-    if len(values) == 0:
-        if not mute:
-            logger.warning(
-                f"no values can be converted from {field} to {return_field}!"
-            )
-        return values
+    values = _build_result_list(identifiers, mapped, keep, mute_warning=return_mapper)
     if keep is False:
-        # flatten list of lists
-        values = list(
-            chain(*[item if isinstance(item, list) else [item] for item in values])
+        values = _flatten(values)
+    converter = _field_converter(
+        df, values=values, field=field, return_field=return_field, keep=keep
+    )
+    mapper = (
+        _build_mapper(identifiers, mapped, keep, mute_warning=False)
+        if return_mapper
+        else None
+    )
+    return _convert_values(values, mapper=mapper, converter=converter)
+
+
+class Standardizer:
+    """Standardizes identifiers against a reference DataFrame.
+
+    The reference-side lookup tables are compiled once and reused across calls,
+    they're read-only afterwards and can be shared between threads. Identifiers
+    are matched once per call, no matter how many fields are returned.
+
+    Args:
+        df: Reference DataFrame.
+        field: The field representing the identifiers.
+        case_sensitive: Whether the mapping is case sensitive.
+        synonyms_field: The field representing the concatenated synonyms.
+        sep: Which separator is used to separate synonyms.
+        keep: {'first', 'last', False}, default 'first'
+            When a synonym maps to multiple standardized values, determines
+            which duplicates to mark as `pandas.DataFrame.duplicated`.
+
+    Examples:
+        >>> standardizer = Standardizer(cell_types_df, field="name")
+        >>> standardizer.standardize(
+        ...     ["T-cell", "B lymphocyte"], return_field=["name", "ontology_id"]
+        ... )
+        {'name': ['T cell', 'B cell'], 'ontology_id': ['CL:0000084', 'CL:0000236']}
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        field: str,
+        *,
+        case_sensitive: bool = False,
+        synonyms_field: str = "synonyms",
+        sep: str = "|",
+        keep: Literal["first", "last", False] = "first",
+    ) -> None:
+        self._df = df
+        self._field = field
+        self._keep = keep
+        self._lookup: _SynonymLookup | None = None
+        if df.shape[0] > 0 and synonyms_field is not None and synonyms_field != "None":
+            self._lookup = _SynonymLookup(
+                df=df,
+                field=field,
+                case_sensitive=case_sensitive,
+                synonyms_field=synonyms_field,
+                sep=sep,
+                keep=keep,
+            ).compile()
+        else:
+            if field not in df.columns:
+                raise KeyError(
+                    f"field '{field}' is invalid! Available fields are: {list(df.columns)}"
+                )
+            # without synonyms, identifiers only match exactly
+            self._field_values = set(df[field].dropna())
+        # {return_field: (converter, rank of its keys)}, built on first use
+        self._converters: dict[str, tuple[dict, dict]] = {}
+        self._lock = threading.Lock()
+
+    def _converter(self, return_field: str, values: list) -> dict:
+        """Field converter restricted to the given values."""
+        with self._lock:
+            if return_field not in self._converters:
+                if return_field not in self._df.columns:
+                    raise KeyError(
+                        f"return_field '{return_field}' is invalid! Available fields"
+                        f" are: {list(self._df.columns)}"
+                    )
+                converter = _field_converter(
+                    self._df,
+                    values=self._df[self._field],
+                    field=self._field,
+                    return_field=return_field,
+                    keep=self._keep,
+                )
+                rank = {k: i for i, k in enumerate(converter)}
+                self._converters[return_field] = (converter, rank)
+            converter, rank = self._converters[return_field]
+        keys = sorted((v for v in set(values) if v in converter), key=rank.__getitem__)
+        return {k: converter[k] for k in keys}
+
+    def standardize(
+        self,
+        identifiers: Iterable,
+        return_field: str | Iterable[str] | None = None,
+        *,
+        return_mapper: bool = False,
+        mute: bool = False,
+    ) -> dict | list:
+        """Standardizes input identifiers.
+
+        Args:
+            identifiers: Identifiers that will be mapped against the field.
+            return_field: The field or a list of fields to return. Defaults to field.
+            return_mapper: If True, returns {input synonyms : standardized field name}.
+            mute: If True, suppresses logging.
+
+        Returns:
+            The same as :func:`standardize` for a single return_field. For a list of
+            fields, a dictionary with the result of each field.
+        """
+        return_fields = (
+            [self._field]
+            if return_field is None
+            else [return_field]
+            if isinstance(return_field, str)
+            else list(return_field)
         )
-    else:
-        # deal with duplications here
-        df = df.drop_duplicates(subset=[field], keep=keep)
+        identifiers = list(identifiers)
+        if self._df.shape[0] == 0 or len(identifiers) == 0:
+            results: dict = {
+                f: {} if return_mapper else identifiers for f in return_fields
+            }
+        else:
+            results = self._standardize(
+                identifiers, return_fields, return_mapper=return_mapper, mute=mute
+            )
+        if return_field is None or isinstance(return_field, str):
+            return results[return_fields[0]]
+        return results
 
-    values_df = df[df[field].isin(values)]
-    mapper = values_df[[field, return_field]].set_index(field)[return_field]
-    if keep is False:
+    def _map(self, identifiers: list) -> list:
+        """Mapped field values with None for identifiers not in the reference."""
+        if self._lookup is not None:
+            return self._lookup.map(identifiers)
+        return [v if v in self._field_values else None for v in identifiers]
+
+    def _standardize(
+        self,
+        identifiers: list,
+        return_fields: list[str],
+        *,
+        return_mapper: bool,
+        mute: bool,
+        mapped: list | None = None,
+    ) -> dict:
+        if mapped is None:
+            mapped = self._map(identifiers)
+        n_mapped = _count_changed(identifiers, mapped)
+        if n_mapped > 0 and not mute:
+            s = "" if n_mapped == 1 else "s"
+            logger.info(f"standardized {n_mapped}/{len(identifiers)} term{s}")
+
+        # both only warn about lists once
+        result_list = _build_result_list(
+            identifiers, mapped, self._keep, mute_warning=return_mapper
+        )
         mapper = (
-            mapper.groupby(field)
-            .agg(lambda x: list(x) if len(x) > 1 else x.iloc[0])
-            .to_dict()
+            _build_mapper(identifiers, mapped, self._keep, mute_warning=False)
+            if return_mapper
+            else None
         )
+        values = _flatten(result_list) if self._keep is False else result_list
 
-    if return_mapper:
-        # deals with the case where the mapper is a list
-        return_dict: dict = {}
-        for k, v in result.items():  # type: ignore
-            if isinstance(v, list):
-                return_dict[k] = []
-                for x in v:
-                    if mapper.get(x) is None:
-                        continue
-                    if isinstance(mapper.get(x), list):
-                        return_dict[k].extend(mapper.get(x))
-                    else:
-                        return_dict[k].append(mapper.get(x))
-            else:
-                if mapper.get(v) is not None:
-                    return_dict[k] = mapper.get(v)
-        # add non-synonyms converted values
-        return_dict.update(
-            {
-                k: v
-                for k, v in mapper.items()
-                if k
-                not in set(
-                    chain(*[v if isinstance(v, list) else [v] for v in result.values()])  # type: ignore
-                )
-            }
+        results: dict = {}
+        for return_field in return_fields:
+            if return_field == self._field:
+                results[return_field] = mapper if return_mapper else result_list
+                continue
+            converter = self._converter(return_field, values)
+            results[return_field] = _convert_values(
+                values, mapper=mapper, converter=converter
+            )
+        return results
+
+
+def standardize_frame(
+    df: pd.DataFrame,
+    references: dict[str, Standardizer | dict[str, Any]],
+    *,
+    n_jobs: int | None = 1,
+    mute: bool = False,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Standardizes multiple columns of a DataFrame against their references.
+
+    Columns that share a reference are standardized together, each distinct value
+    is only matched once across all of them. References are processed
+    concurrently.
+
+    Args:
+        df: DataFrame with the columns to standardize.
+        references: A reference spec for each column to standardize, either a
+            :class:`Standardizer` or a dictionary with the keyword arguments of
+            :class:`Standardizer` (`df`, `field`, ...) and optionally `return_field`.
+            Specs with the same reference DataFrame and arguments share a reference.
+        n_jobs: Number of threads that standardize references.
+            `None` or `-1` uses all CPUs.
+        mute: If True, suppresses logging.
+
+    Returns:
+        A tuple of the standardized DataFrame and a DataFrame of mapping statistics
+        indexed by column: the number of unique values, how many of them were
+        found in the reference, and how many of those were standardized.
+
+    Examples:
+        >>> standardized, stats = standardize_frame(
+        ...     adata.obs,
+        ...     {
+        ...         "cell_type": {"df": cell_types_df, "field": "name"},
+        ...         "tissue": {"df": tissues_df, "field": "name"},
+        ...     },
+        ... )
+    """
+    import pandas as pd
+
+    if n_jobs is None or n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    # {reference key: (Standardizer or its keyword arguments, {column: return_field})}
+    groups: dict[Any, tuple[Standardizer | dict, dict[str, str | None]]] = {}
+    for column, spec in references.items():
+        if column not in df.columns:
+            raise KeyError(
+                f"column '{column}' is invalid! Available columns are: {list(df.columns)}"
+            )
+        if isinstance(spec, Standardizer):
+            key: Any = id(spec)
+            return_field = None
+        else:
+            spec = dict(spec)
+            return_field = spec.pop("return_field", None)
+            if spec.get("keep", "first") is False:
+                raise ValueError("keep=False is not supported by standardize_frame")
+            key = (
+                id(spec["df"]),
+                tuple(sorted((k, v) for k, v in spec.items() if k != "df")),
+            )
+        groups.setdefault(key, (spec, {}))[1][column] = return_field
+
+    def standardize_group(group: tuple) -> dict[str, tuple[pd.Series, dict]]:
+        spec, return_fields = group
+        standardizer = spec if isinstance(spec, Standardizer) else Standardizer(**spec)
+        if standardizer._keep is False:
+            raise ValueError("keep=False is not supported by standardize_frame")
+        uniques = {
+            column: _column_to_list(df[column].dropna().unique())
+            for column in return_fields
+        }
+        # distinct values across all columns of this reference
+        identifiers = list(dict.fromkeys(chain.from_iterable(uniques.values())))
+        fields = {
+            column: standardizer._field if return_field is None else return_field
+            for column, return_field in return_fields.items()
+        }
+        if len(identifiers) == 0:
+            return {column: (df[column], _frame_stats([], {})) for column in fields}
+        mapped = standardizer._map(identifiers)
+        results = standardizer._standardize(
+            identifiers,
+            list(dict.fromkeys(fields.values())),
+            return_mapper=False,
+            mute=True,
+            mapped=mapped,
         )
-        return return_dict
-    else:
-        return [mapper.get(v, v) for v in values]
+        mapped_by_value = dict(zip(identifiers, mapped, strict=False))
+        standardized = {}
+        for column, field in fields.items():
+            series = df[column]
+            mapping = dict(zip(identifiers, results[field], strict=False))
+            new = series.map(mapping, na_action="ignore")
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                new = new.astype("category")
+            standardized[column] = (new, _frame_stats(uniques[column], mapped_by_value))
+        return standardized
+
+    with ThreadPoolExecutor(max_workers=max(1, min(n_jobs, len(groups)))) as executor:
+        outputs = list(executor.map(standardize_group, groups.values()))
+
+    new_df = df.copy()
+    stats = {}
+    for output in outputs:
+        for column, (series, column_stats) in output.items():
+            new_df[column] = series
+            stats[column] = column_stats
+    stats_df = pd.DataFrame.from_dict(
+        {column: stats[column] for column in references},
+        orient="index",
+        columns=["n_unique", "n_mapped", "n_standardized"],
+    )
+    if not mute:
+        for column, row in stats_df.iterrows():
+            if row["n_standardized"] > 0:
+                s = "" if row["n_standardized"] == 1 else "s"
+                logger.info(
+                    f"standardized {row['n_standardized']}/{row['n_unique']} term{s}"
+                    f" in column '{column}'"
+                )
+    return new_df, stats_df
+
+
+def _frame_stats(values: list, mapped_by_value: dict) -> dict:
+    """Mapping statistics of the unique values of a column."""
+    mapped = [mapped_by_value[v] for v in values]
+    return {
+        "n_unique": len(values),
+        "n_mapped": sum(1 for m in mapped if m is not None),
+        "n_standardized": _count_changed(values, mapped),
+    }
+
+
+def _flatten(values: list) -> list:
+    """Flatten list of lists."""
+    return list(chain(*[item if isinstance(item, list) else [item] for item in values]))
+
+
+def _convert_values(values: list, mapper: dict | None, converter: dict) -> dict | list:
+    """Convert mapped field values to return_field values.
+
+    Returns a list if mapper is None, else the mapper with converted values plus
+    the converted values that weren't synonyms.
+    """
+    if mapper is None:
+        return [converter.get(v, v) for v in values]
+
+    result_values: set = set()
+    return_dict: dict = {}
+    for k, v in mapper.items():
+        if isinstance(v, list):
+            # deals with the case where the mapper is a list
+            result_values.update(v)
+            return_dict[k] = []
+            for x in v:
+                converted = converter.get(x)
+                if converted is None:
+                    continue
+                if isinstance(converted, list):
+                    return_dict[k].extend(converted)
+                else:
+                    return_dict[k].append(converted)
+        else:
+            result_values.add(v)
+            converted = converter.get(v)
+            if converted is not None:
+                return_dict[k] = converted
+    # add non-synonyms converted values
+    return_dict.update({k: v for k, v in converter.items() if k not in result_values})
+    return return_dict
+
+
+def _field_converter(
+    df: Any,
+    values: list,
+    field: str,
+    return_field: str,
+    keep: Literal["first", "last", False],
+) -> dict:
+    """Index {field value: return_field value(s)} restricted to the given values.
+
+    With keep=False, field values of multiple rows convert to a list.
+    """
+    df = df.loc[df[field].isin(values), [field, return_field]]
+    if keep is not False:
+        # deal with duplications here
+        df = df.drop_duplicates(subset=[field], keep=keep)
+        return dict(zip(df[field], df[return_field], strict=False))
+    converter: dict = {}
+    for k, v in zip(df[field], df[return_field], strict=False):
+        if k is None or k != k:
+            continue
+        converter.setdefault(k, []).append(v)
+    return {
+        k: v if len(v) > 1 else v[0]
+        for k, v in sorted(converter.items(), key=lambda item: item[0])
+    }
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from ._logger import logger
+from ._standardize import Standardizer
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+
+def standardize_parquet(
+    source: str | Path | list[str | Path],
+    destination: str | Path,
+    column: str,
+    df: pd.DataFrame,
+    field: str,
+    *,
+    return_field: str = None,
+    case_sensitive: bool = False,
+    synonyms_field: str = "synonyms",
+    sep: str = "|",
+    keep: Literal["first", "last"] = "first",
+    n_jobs: int | None = 1,
+    mute: bool = False,
+) -> list[Path]:
+    """Standardizes a column of Parquet files against a concatenated synonyms column.
+
+    Files are streamed row group by row group, so peak memory is bounded by a row
+    group per thread rather than by the file size. Each row group is mapped
+    through a lookup compiled once from `df`, only its distinct values are
+    matched. The standardized column replaces the original one, all other columns
+    are copied as is.
+
+    The standardized column keeps its type if the return field has the same type,
+    string types count as the same. Otherwise, e.g. when mapping names to integer
+    ids, it gets the type of the return field and unmapped values are null.
+
+    Args:
+        source: A Parquet file, a directory of Parquet files or a list of files.
+        destination: The output file for a single source file, otherwise a
+            directory that receives an output file of the same name per source file.
+            Source files with the same name raise a `ValueError`.
+        column: The column to standardize.
+        df: Reference DataFrame.
+        field: The field representing the identifiers.
+        return_field: The field to return. Defaults to field.
+        case_sensitive: Whether the mapping is case sensitive.
+        synonyms_field: The field representing the concatenated synonyms.
+        sep: Which separator is used to separate synonyms.
+        keep: {'first', 'last'}, default 'first'
+            When a synonym maps to multiple standardized values, determines
+            which one is returned.
+        n_jobs: Number of threads that process files concurrently.
+            `None` or `-1` uses all CPUs.
+        mute: If True, suppresses logging.
+
+    Returns:
+        The paths of the written files.
+
+    Examples:
+        >>> standardize_parquet(
+        ...     "obs/", "obs_standardized/", "cell_type", cell_types_df, field="name"
+        ... )
+    """
+    import pyarrow as pa
+
+    if keep not in ("first", "last"):
+        raise ValueError(f"Invalid value for keep: {keep}, must be 'first' or 'last'")
+    if n_jobs is None or n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    if isinstance(source, list | tuple):
+        sources = [Path(path) for path in source]
+    elif Path(source).is_dir():
+        sources = sorted(Path(source).glob("*.parquet"))
+    else:
+        sources = [Path(source)]
+    destination = Path(destination)
+    if len(sources) == 1 and not destination.is_dir():
+        destinations = [destination]
+    else:
+        names = [path.name for path in sources]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(
+                f"source files with the same name would overwrite each other in"
+                f" {destination}: {duplicates}"
+            )
+        destination.mkdir(parents=True, exist_ok=True)
+        destinations = [destination / name for name in names]
+
+    standardizer = Standardizer(
+        df,
+        field=field,
+        case_sensitive=case_sensitive,
+        synonyms_field=synonyms_field,
+        sep=sep,
+        keep=keep,
+    )
+    return_field = field if return_field is None else return_field
+    if return_field not in df.columns:
+        raise KeyError(
+            f"return_field '{return_field}' is invalid! Available fields are:"
+            f" {list(df.columns)}"
+        )
+    return_type = (
+        None if return_field == field else pa.Array.from_pandas(df[return_field]).type
+    )
+
+    def standardize_file(paths: tuple[Path, Path]) -> tuple[int, int]:
+        return _standardize_file(
+            standardizer,
+            *paths,
+            column=column,
+            return_field=return_field,
+            return_type=return_type,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(n_jobs, len(sources)))) as executor:
+        counts = list(
+            executor.map(standardize_file, zip(sources, destinations, strict=True))
+        )
+
+    n_mapped = sum(n for n, _ in counts)
+    n_input = sum(n for _, n in counts)
+    if n_mapped > 0 and not mute:
+        s = "" if n_mapped == 1 else "s"
+        logger.info(f"standardized {n_mapped}/{n_input} term{s}")
+    return destinations
+
+
+def _standardize_file(
+    standardizer: Standardizer,
+    source: Path,
+    destination: Path,
+    column: str,
+    return_field: str,
+    return_type: pa.DataType | None,
+) -> tuple[int, int]:
+    """Stream one file, returns the number of standardized and total rows."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(source)
+    schema = parquet_file.schema_arrow
+    if column not in schema.names:
+        raise KeyError(
+            f"column '{column}' is invalid! Available columns are: {schema.names}"
+        )
+    index = schema.get_field_index(column)
+    column_type = schema.field(index).type
+    is_dictionary = pa.types.is_dictionary(column_type)
+    value_type = column_type.value_type if is_dictionary else column_type
+    output_type = _output_type(value_type, return_type)
+    if output_type != value_type:
+        column_type = (
+            pa.dictionary(column_type.index_type, output_type)
+            if is_dictionary
+            else output_type
+        )
+        schema = schema.set(index, schema.field(index).with_type(column_type))
+    n_mapped = 0
+    with pq.ParquetWriter(destination, schema) as writer:
+        for i in range(parquet_file.num_row_groups):
+            table = parquet_file.read_row_group(i)
+            array, n_changed = _standardize_array(
+                standardizer,
+                table.column(index).combine_chunks(),
+                return_field=return_field,
+                output_type=column_type,
+            )
+            n_mapped += n_changed
+            writer.write_table(table.set_column(index, schema.field(index), array))
+    return n_mapped, parquet_file.metadata.num_rows
+
+
+def _output_type(
+    value_type: pa.DataType, return_type: pa.DataType | None
+) -> pa.DataType:
+    """Value type of the standardized column."""
+    import pyarrow as pa
+
+    def is_string(data_type: pa.DataType) -> bool:
+        return pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+
+    if return_type is None or return_type == value_type:
+        return value_type
+    if is_string(return_type) and is_string(value_type):
+        return value_type
+    return return_type
+
+
+def _standardize_array(
+    standardizer: Standardizer,
+    array: pa.Array,
+    return_field: str,
+    output_type: pa.DataType,
+) -> tuple[pa.Array, int]:
+    """Standardize the distinct values of an array to the output type."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    is_dictionary = pa.types.is_dictionary(array.type)
+    encoded = array if is_dictionary else array.dictionary_encode()
+    identifiers = encoded.dictionary.to_pylist()
+    if len(identifiers) == 0:
+        return array.cast(output_type), 0
+
+    mapped = standardizer._map(identifiers)
+    values = standardizer._standardize(
+        identifiers, [return_field], return_mapper=False, mute=True, mapped=mapped
+    )[return_field]
+    value_type = output_type.value_type if is_dictionary else output_type
+    if value_type != encoded.type.value_type:
+        # unmapped identifiers can't be represented in the return field's type
+        values = [
+            None if m is None else v for v, m in zip(values, mapped, strict=False)
+        ]
+    changed = pa.array(
+        [m is not None and m != o for o, m in zip(identifiers, mapped, strict=False)]
+    )
+    n_changed = pc.sum(changed.take(encoded.indices)).as_py() or 0
+
+    standardized = pa.array(values, type=value_type, from_pandas=True).take(
+        encoded.indices
+    )
+    if is_dictionary:
+        standardized = standardized.dictionary_encode().cast(output_type)
+    return standardized, n_changed
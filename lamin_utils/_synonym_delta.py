@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+from ._logger import logger
+from ._map_synonyms import (
+    _check_fields,
+    _lookup_keys,
+    explode_aggregated_column_to_map,
+    map_synonyms,
+    to_str,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pandas as pd
+
+
+class SynonymDelta:
+    """Changed synonym → term links between two versions of a reference table.
+
+    Identifiers whose lookup keys aren't part of the delta map to the same values
+    against both versions, hence only the affected ones need to be remapped when
+    upgrading a reference.
+
+    Examples:
+        >>> delta = SynonymDelta.from_dfs(old_df, new_df, field="name")
+        >>> mapper = delta.apply(mapper, identifiers=identifiers)
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        field: str,
+        *,
+        changed_values: set,
+        changed_keys: set,
+        case_sensitive: bool = False,
+        synonyms_field: str = "synonyms",
+        sep: str = "|",
+        keep: Literal["first", "last", False] = "first",
+    ) -> None:
+        self._df = df
+        self._field = field
+        # field values that were added or removed, matched exactly
+        self._changed_values = changed_values
+        # case-folded field values and synonyms with changed mappings
+        self._changed_keys = changed_keys
+        self._case_sensitive = case_sensitive
+        self._synonyms_field = synonyms_field
+        self._sep = sep
+        self._keep = keep
+
+    @classmethod
+    def from_dfs(
+        cls,
+        old_df: pd.DataFrame,
+        new_df: pd.DataFrame,
+        field: str,
+        *,
+        case_sensitive: bool = False,
+        synonyms_field: str = "synonyms",
+        sep: str = "|",
+        keep: Literal["first", "last", False] = "first",
+    ) -> SynonymDelta:
+        """Diff two versions of a reference table.
+
+        Args:
+            old_df: Previous version of the reference DataFrame.
+            new_df: New version of the reference DataFrame.
+            field: The field representing the identifiers.
+            case_sensitive: Whether the mapping is case sensitive.
+            synonyms_field: The field representing the concatenated synonyms.
+            sep: Separator used to split synonyms.
+            keep: {'first', 'last', False}, default 'first'
+                When a synonym maps to multiple standardized values, determines
+                which duplicates to mark as `pandas.DataFrame.duplicated`.
+        """
+        for df in (old_df, new_df):
+            _check_fields(df, field=field, synonyms_field=synonyms_field)
+
+        old_values = set(old_df[field].dropna())
+        new_values = set(new_df[field].dropna())
+        changed_keys: set = set()
+        if not case_sensitive:
+            changed_keys |= _changed_keys(
+                _field_series(old_df, field), _field_series(new_df, field)
+            )
+        changed_keys |= _changed_keys(
+            _synonym_series(old_df, field, synonyms_field, sep, keep, case_sensitive),
+            _synonym_series(new_df, field, synonyms_field, sep, keep, case_sensitive),
+        )
+        return cls(
+            new_df,
+            field,
+            changed_values=old_values ^ new_values,
+            changed_keys=changed_keys,
+            case_sensitive=case_sensitive,
+            synonyms_field=synonyms_field,
+            sep=sep,
+            keep=keep,
+        )
+
+    def __len__(self) -> int:
+        """Number of changed lookup keys."""
+        return len(self._changed_values) + len(self._changed_keys)
+
+    def affected(self, identifiers: Iterable) -> list:
+        """Unique identifiers whose mapping may differ between the versions."""
+        unique = list(dict.fromkeys(identifiers))
+        return [
+            identifier
+            for identifier, key in zip(
+                unique, _lookup_keys(unique, self._case_sensitive), strict=True
+            )
+            if identifier in self._changed_values or key in self._changed_keys
+        ]
+
+    def apply(
+        self, mapper: dict, identifiers: Iterable | None = None, mute: bool = False
+    ) -> dict:
+        """Update a mapper computed against the old version of the reference.
+
+        Args:
+            mapper: A mapper from :func:`~lamin_utils._map_synonyms.map_synonyms` with
+                `return_mapper=True`.
+            identifiers: All identifiers the mapper was computed for. Without them
+                only the keys of the mapper are considered, and identifiers that
+                weren't mapped before can't be picked up.
+            mute: If True, suppresses logging.
+
+        Returns:
+            A new mapper against the new version of the reference.
+        """
+        candidates = list(mapper) if identifiers is None else [*mapper, *identifiers]
+        affected = self.affected(candidates)
+        affected_set = set(affected)
+        updated = {k: v for k, v in mapper.items() if k not in affected_set}
+        if len(affected) > 0:
+            updated.update(
+                map_synonyms(
+                    self._df,
+                    identifiers=affected,
+                    field=self._field,
+                    case_sensitive=self._case_sensitive,
+                    return_mapper=True,
+                    mute=True,
+                    synonyms_field=self._synonyms_field,
+                    sep=self._sep,
+                    keep=self._keep,
+                    mute_warning=True,
+                )
+            )
+        if not mute:
+            s = "" if len(affected) == 1 else "s"
+            logger.info(
+                f"remapped {len(affected)}/{len(dict.fromkeys(candidates))} term{s}"
+            )
+        return updated
+
+
+def _field_series(df: pd.DataFrame, field: str) -> pd.Series:
+    """Case-insensitive field map as a Series, keeps first occurrences."""
+    import pandas as pd
+
+    values = df[field].dropna()
+    keys = to_str(values, case_sensitive=False)
+    first = ~keys.duplicated(keep="first").to_numpy()
+    return pd.Series(values.to_numpy()[first], index=keys.to_numpy()[first])
+
+
+def _synonym_series(
+    df: pd.DataFrame,
+    field: str,
+    synonyms_field: str,
+    sep: str,
+    keep: Literal["first", "last", False],
+    case_sensitive: bool,
+) -> pd.Series:
+    """Synonym map as a Series, case-folded duplicates keep the first synonym."""
+    series = explode_aggregated_column_to_map(
+        df, agg_col=synonyms_field, target_col=field, keep=keep, sep=sep
+    )
+    if keep is False:
+        series = series.map(tuple)
+    if not case_sensitive:
+        series.index = series.index.str.lower()
+        series = series[~series.index.duplicated(keep="first")]
+    return series
+
+
+def _changed_keys(old: pd.Series, new: pd.Series) -> set:
+    """Keys that were added, removed or map to a different value."""
+    import pandas as pd
+
+    joined = pd.concat(
+        {"old": old.astype(object), "new": new.astype(object)}, axis=1, join="outer"
+    )
+    both_missing = joined["old"].isna() & joined["new"].isna()
+    changed = (joined["old"] != joined["new"]) & ~both_missing
+    return set(joined.index[changed.to_numpy()])
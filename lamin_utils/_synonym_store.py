@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Literal
+
+from ._map_synonyms import _lower_strings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+    import pandas as pd
+
+
+class SynonymStore:
+    """Memory-compact store of synonym → term links.
+
+    Terms and synonyms are interned once as unique string arrays (Arrow-backed if
+    available), links are stored as integer arrays in CSR layout (`offsets` into
+    `term_codes`). Synonyms are ordered by their hashes for lookups, case-folded
+    synonyms are only kept as a sorted array of hashes.
+
+    Semantics match :func:`~lamin_utils._map_synonyms.explode_aggregated_column_to_map`.
+
+    Examples:
+        >>> store = SynonymStore.from_df(genes_df, field="symbol")
+        >>> store.get("fancd1", case_sensitive=False)
+        'BRCA2'
+        >>> store.memory_usage()
+        1432
+    """
+
+    def __init__(
+        self,
+        terms: pd.api.extensions.ExtensionArray | np.ndarray,
+        synonyms: pd.api.extensions.ExtensionArray | np.ndarray,
+        hashes: np.ndarray,
+        folded_hashes: np.ndarray,
+        folded_order: np.ndarray,
+        offsets: np.ndarray,
+        term_codes: np.ndarray,
+        field: str | None = None,
+        synonyms_field: str | None = None,
+    ) -> None:
+        self._terms = terms
+        # unique synonyms sorted by their hashes
+        self._synonyms = synonyms
+        self._hashes = hashes
+        # sorted hashes of the lowercased synonyms and the synonyms they belong to
+        self._folded_hashes = folded_hashes
+        self._folded_order = folded_order
+        self._offsets = offsets
+        # -1 encodes a missing term
+        self._term_codes = term_codes
+        self._field = field
+        self._synonyms_field = synonyms_field
+
+    @classmethod
+    def from_df(
+        cls,
+        df: pd.DataFrame,
+        field: str,
+        synonyms_field: str = "synonyms",
+        sep: str = "|",
+    ) -> SynonymStore:
+        """Build the store from a reference DataFrame.
+
+        Args:
+            df: Reference DataFrame.
+            field: The field representing the terms.
+            synonyms_field: The field representing the concatenated synonyms.
+            sep: Separator used to split synonyms.
+        """
+        import numpy as np
+        import pandas as pd
+
+        from ._map_synonyms import _explode_synonyms
+
+        df_explode = _explode_synonyms(
+            df, agg_col=synonyms_field, target_col=field, sep=sep
+        )
+        syn_codes, synonyms = pd.factorize(df_explode[synonyms_field])
+        term_codes, terms = pd.factorize(df_explode[field])
+        n_synonyms = len(synonyms)
+
+        # order synonyms by hash and recode the links accordingly
+        synonyms = pd.Series(synonyms.array, copy=False)
+        hashes = pd.util.hash_pandas_object(synonyms, index=False).to_numpy()
+        by_hash = np.argsort(hashes, kind="stable")
+        recode = np.empty(n_synonyms, dtype=np.intp)
+        recode[by_hash] = np.arange(n_synonyms)
+        syn_codes = recode[syn_codes]
+        synonyms = synonyms.iloc[by_hash].reset_index(drop=True)
+        hashes = hashes[by_hash]
+
+        folded_hashes = _hash_strings(_lower_strings(synonyms.tolist()))
+        folded_order = np.argsort(folded_hashes, kind="stable")
+
+        # group links by synonym, stable to keep the row order within a synonym
+        order = np.argsort(syn_codes, kind="stable")
+        offsets = np.zeros(n_synonyms + 1, dtype=_code_dtype(len(syn_codes)))
+        np.cumsum(np.bincount(syn_codes, minlength=n_synonyms), out=offsets[1:])
+        return cls(
+            terms=terms.array,
+            synonyms=synonyms.array,
+            hashes=hashes,
+            folded_hashes=folded_hashes[folded_order],
+            folded_order=folded_order.astype(_code_dtype(n_synonyms)),
+            offsets=offsets,
+            term_codes=term_codes[order].astype(_code_dtype(len(terms))),
+            field=field,
+            synonyms_field=synonyms_field,
+        )
+
+    def __len__(self) -> int:
+        """Number of unique synonyms."""
+        return len(self._synonyms)
+
+    def _codes(self, keys: list, case_sensitive: bool) -> list:
+        """Synonym codes of keys, -1 if not found."""
+        import numpy as np
+
+        codes = [-1] * len(keys)
+        positions = [i for i, k in enumerate(keys) if isinstance(k, str)]
+        if len(self._synonyms) == 0 or len(positions) == 0:
+            return codes
+        queries = [keys[i] for i in positions]
+        if not case_sensitive:
+            queries = _lower_strings(queries)
+        hashes = self._hashes if case_sensitive else self._folded_hashes
+        query_hashes = _hash_strings(queries)
+        starts = np.searchsorted(hashes, query_hashes, side="left").tolist()
+        ends = np.searchsorted(hashes, query_hashes, side="right").tolist()
+        if case_sensitive:
+            candidates = [
+                range(start, end) for start, end in zip(starts, ends, strict=True)
+            ]
+        else:
+            candidates = [
+                self._folded_order[start:end].tolist()
+                for start, end in zip(starts, ends, strict=True)
+            ]
+        # the candidates' synonyms, lowercased in one pass if not case-sensitive
+        candidate_synonyms = [self._synonyms[c] for cs in candidates for c in cs]
+        if not case_sensitive:
+            candidate_synonyms = _lower_strings(candidate_synonyms)
+        candidate_synonyms = iter(candidate_synonyms)
+        for i, q, cs in zip(positions, queries, candidates, strict=True):
+            # verify candidates to rule out hash collisions
+            matches = [c for c in cs if next(candidate_synonyms) == q]
+            if matches:
+                # case-folded duplicates resolve to the smallest synonym, like the
+                # sorted groupby index
+                codes[i] = min(matches, key=lambda c: self._synonyms[c])
+        return codes
+
+    def _resolve(self, code: int, keep: Literal["first", "last", False]):
+        term_codes = self._term_codes[self._offsets[code] : self._offsets[code + 1]]
+        if keep is False:
+            return [self._terms[t] if t >= 0 else float("nan") for t in term_codes]
+        if keep not in ("first", "last"):
+            raise ValueError(f"Invalid value for keep: {keep}")
+        valid = term_codes[term_codes >= 0]
+        if len(valid) == 0:
+            return None
+        return self._terms[valid[0] if keep == "first" else valid[-1]]
+
+    def get(
+        self,
+        synonym: str,
+        *,
+        case_sensitive: bool = True,
+        keep: Literal["first", "last", False] = "first",
+    ):
+        """Term(s) of a synonym, None if not found."""
+        code = self._codes([synonym], case_sensitive=case_sensitive)[0]
+        return None if code < 0 else self._resolve(code, keep)
+
+    def map(
+        self,
+        keys: Iterable,
+        *,
+        case_sensitive: bool = True,
+        keep: Literal["first", "last", False] = "first",
+    ) -> list:
+        """Terms of synonyms, None for keys that aren't synonyms."""
+        codes = self._codes(list(keys), case_sensitive=case_sensitive)
+        resolved: dict = {}
+        mapped = []
+        for code in codes:
+            if code < 0:
+                mapped.append(None)
+                continue
+            if code not in resolved:
+                resolved[code] = self._resolve(code, keep)
+            mapped.append(resolved[code])
+        return mapped
+
+    def to_series(self, keep: Literal["first", "last", False] = "first") -> pd.Series:
+        """Expand to a Series indexed by synonyms."""
+        import pandas as pd
+
+        series = pd.Series(
+            [self._resolve(code, keep) for code in range(len(self._synonyms))],
+            index=pd.Index(self._synonyms, name=self._synonyms_field),
+            name=self._field,
+            dtype=object,
+        )
+        return series.sort_index()
+
+    def memory_usage(self) -> int:
+        """Memory footprint in bytes, including the interned strings."""
+        n_bytes = 0
+        for array in (self._terms, self._synonyms):
+            n_bytes += array.nbytes
+            if array.dtype == object:
+                n_bytes += sum(sys.getsizeof(s) for s in array)
+        for array in (
+            self._offsets,
+            self._term_codes,
+            self._hashes,
+            self._folded_hashes,
+            self._folded_order,
+        ):
+            n_bytes += array.nbytes
+        return n_bytes
+
+
+def _code_dtype(n: int):
+    import numpy as np
+
+    return np.int32 if n < np.iinfo(np.int32).max else np.int64
+
+
+def _hash_strings(values: list) -> np.ndarray:
+    import numpy as np
+    import pandas as pd
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return pd.util.hash_array(array, categorize=False)
@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ._map_synonyms import to_str
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+
+
+class _DiskVocabulary(ABC):
+    """Base class of vocabularies that are stored on disk and memory-mapped.
+
+    Vocabularies hold the case-sensitive strings of :func:`to_str` and their
+    lowercased variants. Numbers are stored as strings, integral floats like
+    integers, so `9606` and `9606.0` are the same value. They are read-only,
+    several threads or processes can share one page-cached vocabulary.
+    """
+
+    _format: str
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        meta_path = self._path / "meta.json"
+        if not meta_path.exists():
+            raise FileNotFoundError(f"no vocabulary found at {self._path}")
+        self._meta = json.loads(meta_path.read_text())
+        if self._meta.get("format") != self._format:
+            raise ValueError(
+                f"{self._path} is a '{self._meta.get('format')}' vocabulary, not"
+                f" '{self._format}'"
+            )
+
+    @property
+    def path(self) -> Path:
+        """Directory of the vocabulary files."""
+        return self._path
+
+    def __len__(self) -> int:
+        """Number of unique case-sensitive values."""
+        return self._meta["n_values"]
+
+    @property
+    def _sample(self) -> str | float | None:
+        """First non-missing reference value, for the type compatibility check."""
+        return self._meta.get("sample")
+
+    @abstractmethod
+    def _contains(self, keys: np.ndarray, case_sensitive: bool) -> np.ndarray:
+        """Membership of normalized string keys."""
+
+    def isin(self, values: Iterable, *, case_sensitive: bool = True) -> np.ndarray:
+        """Check if values are in the vocabulary, same normalization as :func:`validate`."""
+        return self._contains(_normalize(values, case_sensitive), case_sensitive)
+
+    @staticmethod
+    def _unique_strings(
+        field_values: Iterable,
+    ) -> tuple[np.ndarray, np.ndarray, str | float | None]:
+        """Unique case-sensitive and lowercased strings of the field values.
+
+        Also returns the first non-missing value as the type sample.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if not isinstance(field_values, pd.Series | pd.Index):
+            field_values = pd.Series(list(field_values), dtype=object)
+        strings = pd.unique(_normalize(field_values, case_sensitive=True))
+        folded = pd.unique(np.array([s.lower() for s in strings], dtype=object))
+        sample = next((v for v in field_values if not pd.isna(v)), None)
+        if isinstance(sample, np.generic):
+            sample = sample.item()
+        if not isinstance(sample, str | int | float):
+            sample = None
+        return strings, folded, sample
+
+    @classmethod
+    def _write_meta(cls, path: Path, **meta) -> None:
+        meta = {"format": cls._format, **meta}
+        (path / "meta.json").write_text(json.dumps(meta))
+
+
+class HashedVocabulary(_DiskVocabulary):
+    """On-disk vocabulary with a Bloom filter prefilter and an exact hash index.
+
+    Per variant (case-sensitive and lowercased), the files hold a Bloom filter over
+    the 64-bit hashes of the strings, the sorted hashes, and the UTF-8 encoded
+    strings in hash order with their offsets. Most identifiers that aren't in the
+    vocabulary are rejected by the Bloom filter; the rest are looked up in the
+    sorted hashes and confirmed against the stored strings. All arrays are
+    memory-mapped, so memory use during validation is bounded by the batch.
+
+    Args:
+        path: Directory written by :meth:`build`.
+
+    Examples:
+        >>> vocabulary = HashedVocabulary.build(variants_df["id"], "variants.vocab")
+        >>> validate(identifiers, vocabulary)
+    """
+
+    _format = "hashed"
+
+    def __init__(self, path: str | Path) -> None:
+        import numpy as np
+
+        super().__init__(path)
+        self._variants = {}
+        for case_sensitive, name in ((True, "values"), (False, "folded")):
+            self._variants[case_sensitive] = (
+                np.load(self._path / f"{name}.bloom.npy", mmap_mode="r"),
+                np.load(self._path / f"{name}.hashes.npy", mmap_mode="r"),
+                *_load_strings(self._path, name),
+            )
+
+    @classmethod
+    def build(
+        cls,
+        field_values: Iterable,
+        path: str | Path,
+        *,
+        false_positive_rate: float = 0.01,
+    ) -> HashedVocabulary:
+        """Build the vocabulary files from reference values and open them.
+
+        Args:
+            field_values: The iterable containing valid values.
+            path: Directory to write the vocabulary files to.
+            false_positive_rate: Target false positive rate of the Bloom filter.
+                Only affects how many identifiers are checked against the exact
+                index, not the result.
+        """
+        import numpy as np
+
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        strings, folded, sample = cls._unique_strings(field_values)
+        n_values = max(len(strings), 1)
+        # optimal Bloom filter size and number of hash functions
+        n_bits = max(int(-n_values * np.log(false_positive_rate) / np.log(2) ** 2), 8)
+        n_hashes = max(round(n_bits / n_values * np.log(2)), 1)
+        for name, values in (("values", strings), ("folded", folded)):
+            hashes = _hash_strings(values)
+            order = np.argsort(hashes, kind="stable")
+            _write_strings(path, name, [s.encode() for s in values[order]])
+            np.save(path / f"{name}.hashes.npy", hashes[order])
+            np.save(path / f"{name}.bloom.npy", _bloom_bits(hashes, n_bits, n_hashes))
+        cls._write_meta(
+            path,
+            n_values=len(strings),
+            sample=sample,
+            n_bits=n_bits,
+            n_hashes=n_hashes,
+        )
+        return cls(path)
+
+    def _contains(self, keys: np.ndarray, case_sensitive: bool) -> np.ndarray:
+        import numpy as np
+
+        bloom, hashes, offsets, strings = self._variants[case_sensitive]
+        matches = np.zeros(len(keys), dtype=bool)
+        if len(hashes) == 0 or len(keys) == 0:
+            return matches
+        positions = np.arange(len(keys))
+        query_hashes = _hash_strings(keys)
+        maybe = _bloom_contains(
+            bloom, query_hashes, self._meta["n_bits"], self._meta["n_hashes"]
+        )
+        positions, query_hashes = positions[maybe], query_hashes[maybe]
+        starts = np.searchsorted(hashes, query_hashes, side="left")
+        ends = np.searchsorted(hashes, query_hashes, side="right")
+        # confirm the positives against the stored strings
+        _confirm(matches, keys, positions, starts, ends, offsets, strings)
+        return matches
+
+
+class SortedVocabulary(_DiskVocabulary):
+    """On-disk vocabulary of sorted strings, searched by vectorized binary search.
+
+    Per variant (case-sensitive and lowercased), the files hold the deduplicated
+    UTF-8 encoded strings in sorted order with their offsets, and a fixed-width
+    array of their first `prefix_length` bytes. Identifiers are looked up with
+    `numpy.searchsorted` over the memory-mapped prefixes; only identifiers that
+    are longer than the prefix are confirmed against the stored strings.
+
+    Compared to :class:`HashedVocabulary`, the files are smaller and lookups
+    don't hash, but every lookup reads from the prefix array.
+
+    Args:
+        path: Directory written by :meth:`build`.
+
+    Examples:
+        >>> vocabulary = SortedVocabulary.build(genes_df["symbol"], "genes.vocab")
+        >>> inspect(vocabulary, identifiers, field="symbol")
+    """
+
+    _format = "sorted"
+
+    def __init__(self, path: str | Path) -> None:
+        import numpy as np
+
+        super().__init__(path)
+        self._variants = {}
+        for case_sensitive, name in ((True, "values"), (False, "folded")):
+            self._variants[case_sensitive] = (
+                np.load(self._path / f"{name}.prefixes.npy", mmap_mode="r"),
+                *_load_strings(self._path, name),
+            )
+
+    @classmethod
+    def build(
+        cls,
+        field_values: Iterable,
+        path: str | Path,
+        *,
+        prefix_length: int = 32,
+    ) -> SortedVocabulary:
+        """Build the vocabulary files from reference values and open them.
+
+        Args:
+            field_values: The iterable containing valid values.
+            path: Directory to write the vocabulary files to.
+            prefix_length: Maximal number of bytes per string in the fixed-width
+                search array. Shorter strings need no confirmation, longer ones
+                make the array larger.
+        """
+        import numpy as np
+
+        if prefix_length < 1:
+            raise ValueError("prefix_length must be positive")
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        strings, folded, sample = cls._unique_strings(field_values)
+        width = max([len(s.encode()) for s in strings] + [1])
+        width = min(width, prefix_length)
+        for name, values in (("values", strings), ("folded", folded)):
+            encoded = sorted(s.encode() for s in values)
+            _write_strings(path, name, encoded)
+            np.save(path / f"{name}.prefixes.npy", np.array(encoded, dtype=f"S{width}"))
+        cls._write_meta(path, n_values=len(strings), sample=sample, prefix_length=width)
+        return cls(path)
+
+    def _contains(self, keys: np.ndarray, case_sensitive: bool) -> np.ndarray:
+        import numpy as np
+
+        prefixes, offsets, strings = self._variants[case_sensitive]
+        matches = np.zeros(len(keys), dtype=bool)
+        if len(prefixes) == 0 or len(keys) == 0:
+            return matches
+        positions = np.arange(len(keys))
+        encoded = [k.encode() for k in keys]
+        lengths = np.array([len(e) for e in encoded], dtype=np.int64)
+        queries = np.array(encoded, dtype=prefixes.dtype)
+        starts = np.searchsorted(prefixes, queries, side="left")
+        ends = np.searchsorted(prefixes, queries, side="right")
+        # an identifier shorter than the prefix equals the first stored string of
+        # its range if their lengths agree; numpy's bytes ignore trailing null
+        # bytes, so identifiers with null bytes are confirmed like long ones
+        is_short = (lengths < self._meta["prefix_length"]) & np.array(
+            [b"\0" not in e for e in encoded], dtype=bool
+        )
+        first = np.minimum(starts, len(prefixes) - 1)
+        matches[positions[is_short]] = (
+            (ends > starts) & (offsets[first + 1] - offsets[first] == lengths)
+        )[is_short]
+        is_long = ~is_short & (ends > starts)
+        _confirm(
+            matches,
+            keys,
+            positions[is_long],
+            starts[is_long],
+            ends[is_long],
+            offsets,
+            strings,
+        )
+        return matches
+
+
+def _normalize(values: Iterable, case_sensitive: bool) -> np.ndarray:
+    """String keys of :func:`to_str`, numbers are converted with :func:`_number_str`."""
+    import numpy as np
+    import pandas as pd
+
+    if not isinstance(values, pd.Series | pd.Index):
+        values = pd.Index(list(values), dtype=object)
+    keys = to_str(values, case_sensitive=True).to_numpy(dtype=object)
+    keys = [k if isinstance(k, str) else _number_str(k) for k in keys]
+    if not case_sensitive:
+        keys = [k.lower() for k in keys]
+    return np.array(keys, dtype=object)
+
+
+def _number_str(value) -> str:
+    """String of a number, integral floats are formatted like integers."""
+    import numpy as np
+
+    if isinstance(value, float | np.floating) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _write_strings(path: Path, name: str, encoded: list[bytes]) -> None:
+    """Write encoded strings as one blob with their offsets."""
+    import numpy as np
+
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    (path / f"{name}.strings").write_bytes(b"".join(encoded))
+    np.save(path / f"{name}.offsets.npy", offsets)
+
+
+def _load_strings(path: Path, name: str) -> tuple[np.ndarray, np.ndarray]:
+    import numpy as np
+
+    strings_path = path / f"{name}.strings"
+    # empty files can't be memory-mapped
+    strings = (
+        np.memmap(strings_path, dtype=np.uint8, mode="r")
+        if strings_path.stat().st_size > 0
+        else np.zeros(0, dtype=np.uint8)
+    )
+    return np.load(path / f"{name}.offsets.npy", mmap_mode="r"), strings
+
+
+def _confirm(
+    matches: np.ndarray,
+    keys: np.ndarray,
+    positions: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    offsets: np.ndarray,
+    strings: np.ndarray,
+) -> None:
+    """Set matches of keys that equal a stored string in their candidate range."""
+    for i, start, end in zip(
+        positions.tolist(), starts.tolist(), ends.tolist(), strict=True
+    ):
+        encoded = keys[i].encode()
+        for j in range(start, end):
+            if strings[offsets[j] : offsets[j + 1]].tobytes() == encoded:
+                matches[i] = True
+                break
+
+
+def _hash_strings(values: np.ndarray) -> np.ndarray:
+    import numpy as np
+    import pandas as pd
+
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.uint64)
+    return pd.util.hash_array(np.asarray(values, dtype=object), categorize=False)
+
+
+def _bloom_positions(hashes: np.ndarray, n_bits: int, i: int) -> np.ndarray:
+    """Bit positions of the i-th hash function, derived by double hashing."""
+    import numpy as np
+
+    h1 = hashes & np.uint64(0xFFFFFFFF)
+    h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+    return (h1 + np.uint64(i) * h2) % np.uint64(n_bits)
+
+
+def _bloom_bits(hashes: np.ndarray, n_bits: int, n_hashes: int) -> np.ndarray:
+    import numpy as np
+
+    bits = np.zeros((n_bits + 7) // 8, dtype=np.uint8)
+    for i in range(n_hashes):
+        positions = _bloom_positions(hashes, n_bits, i)
+        np.bitwise_or.at(
+            bits,
+            positions >> np.uint64(3),
+            np.left_shift(1, positions & np.uint64(7)).astype(np.uint8),
+        )
+    return bits
+
+
+def _bloom_contains(
+    bits: np.ndarray, hashes: np.ndarray, n_bits: int, n_hashes: int
+) -> np.ndarray:
+    import numpy as np
+
+    maybe = np.ones(len(hashes), dtype=bool)
+    for i in range(n_hashes):
+        positions = _bloom_positions(hashes, n_bits, i)
+        maybe &= (
+            (bits[positions >> np.uint64(3)] >> (positions & np.uint64(7))) & 1
+        ).astype(bool)
+    return maybe
@@ -90,6 +90,20 @@ def test_inspect_inspect_synonyms(genes):
     result = inspect(df=df, identifiers=data["gene symbol"], field="symbol")
 
 
+def test_inspect_synonyms_mapper(genes):
+    from lamin_utils._map_synonyms import map_synonyms
+
+    df, _ = genes
+    identifiers = ["a1cf", "FANCD1", "fad", "A1BG", "A1BG", "corrupted", None]
+    expected = {"a1cf": "A1CF", "FANCD1": "BRCA2", "fad": "BRCA2"}
+
+    result = inspect(df=df, identifiers=identifiers, field="symbol")
+    assert result.synonyms_mapper == expected
+    assert result.synonyms_mapper == map_synonyms(
+        df, result.non_validated, field="symbol", return_mapper=True
+    )
+
+
 def test_inspect_return_df(genes):
     df, data = genes
 
@@ -209,3 +223,125 @@ def test_validate(genes):
         identifiers=df["symbol"],
         field_values=df["symbol"],
     ).tolist() == [True, True, True]
+
+
+def test_validator(genes):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from lamin_utils._inspect import Validator
+
+    df, _ = genes
+    validator = Validator(df["symbol"])
+    batches = [["A1CF", "a1cf", None], ["BRCA2", "brca2", ""], []]
+    for case_sensitive in (True, False):
+        for batch in batches:
+            assert (
+                validator.validate(batch, case_sensitive=case_sensitive).tolist()
+                == validate(
+                    batch, df["symbol"], case_sensitive=case_sensitive, mute=True
+                ).tolist()
+            )
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(validator.validate, batches * 10))
+    assert [r.tolist() for r in results[:3]] == [
+        [True, False, False],
+        [True, False, False],
+        [],
+    ]
+
+    with pytest.raises(TypeError, match="Type mismatch"):
+        Validator(df["symbol"]).validate([1, 2])
+
+    # generators are consumed once
+    identifiers = ["A1CF", "XYZ", "BRCA2"]
+    expected = [True, False, True]
+    assert validator.validate(x for x in identifiers).tolist() == expected
+    assert validate((x for x in identifiers), df["symbol"]).tolist() == expected
+
+
+def test_inspect_result_lazy():
+    from lamin_utils._inspect import InspectResult
+
+    identifiers = ["A1CF", "A1BG", "A1BG", "", None, "corrupted"]
+    result = InspectResult(
+        identifiers=identifiers,
+        matches=np.array([True, True, True, False, False, False]),
+    )
+    assert result._df is None and result._validated is None
+    assert result.frac_validated == 66.7
+    assert result._df is None
+    assert result.validated == ["A1CF", "A1BG"]
+    assert result.non_validated == ["corrupted"]
+    assert (result.n_unique, result.n_empty) == (3, 3)
+    assert result.df["__validated__"].tolist() == [True] * 3 + [False] * 3
+    assert result.df is result.df
+
+    # backward compatible eager construction
+    result = InspectResult(result.df, ["A1CF"], [], 100.0, 0, 1)
+    assert result.validated == ["A1CF"]
+    assert result.frac_validated == 100.0
+
+
+def test_validate_numeric():
+    field_values = pd.Series([9606, 10090, 10116])
+    identifiers = [9606, 7955, 10090]
+    for case_sensitive in (True, False):
+        assert validate(
+            identifiers, field_values, case_sensitive=case_sensitive
+        ).tolist() == [True, False, True]
+    # floats match integers, NaN matches NaN
+    assert validate(
+        np.array([9606.0, np.nan, 1.5]), pd.Series([np.nan, 9606.0, 3.0])
+    ).tolist() == [True, True, False]
+
+    from lamin_utils._inspect import Validator
+
+    validator = Validator(field_values)
+    assert validator.validate(identifiers).tolist() == [True, False, True]
+    assert validator.validate([9606.0, 2.5]).tolist() == [True, False]
+
+    df = pd.DataFrame({"taxon_id": field_values, "synonyms": ["", "", ""]})
+    result = inspect(df=df, identifiers=identifiers + [9606], field="taxon_id")
+    assert result.validated == [9606, 10090]
+    assert result.non_validated == [7955]
+    assert result.n_empty == 1
+
+
+def test_validate_many(genes):
+    from lamin_utils._inspect import Validator, validate_many
+
+    reference_df = genes[0]
+    symbols = reference_df["symbol"]
+    df = pd.DataFrame(
+        {
+            "symbol": ["A1CF", "A1BG", "A1CF", "XYZ"],
+            "symbol_copy": ["A1CF", "A1BG", "BRCA2", None],
+            "taxon_id": [9606, 10090, 7955, 9606],
+        }
+    )
+    validator = Validator(symbols)
+    results, summary = validate_many(
+        df,
+        {
+            "symbol": symbols,
+            "symbol_copy": validator,
+            "taxon_id": pd.Series([9606, 10090]),
+        },
+        n_jobs=2,
+    )
+    for column in ("symbol", "symbol_copy"):
+        expected = validate(df[column].tolist(), symbols, mute=True)
+        assert results[column].df["__validated__"].tolist() == expected.tolist()
+    assert results["symbol"].non_validated == ["XYZ"]
+    assert results["taxon_id"].non_validated == [7955]
+    assert summary.loc["symbol"].to_dict() == {
+        "n_unique": 3,
+        "n_validated": 2,
+        "n_non_validated": 1,
+        "n_empty": 1,
+        "frac_validated": 66.7,
+    }
+    assert summary.index.tolist() == ["symbol", "symbol_copy", "taxon_id"]
+
+    with pytest.raises(KeyError):
+        validate_many(df, {"missing": symbols})
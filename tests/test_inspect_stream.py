@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+from lamin_utils._inspect import Validator, inspect
+from lamin_utils._inspect_stream import inspect_stream
+
+
+@pytest.fixture(scope="module")
+def genes():
+    return pd.DataFrame(
+        {"symbol": ["A1CF", "A1BG", "BRCA2"], "synonyms": ["", "", "FANCD1"]}
+    )
+
+
+def test_inspect_stream(genes):
+    identifiers = ["A1CF", "XYZ", None, "A1CF", "A1BG", "", "a1cf", "XYZ", "FANCD1"]
+    expected = inspect(genes, identifiers, field="symbol", mute=True)
+    for chunk_size in (1, 2, 4, 100):
+        chunks = (
+            pd.Series(identifiers[i : i + chunk_size])
+            for i in range(0, len(identifiers), chunk_size)
+        )
+        result = inspect_stream(chunks, Validator(genes["symbol"]))
+        assert result.validated == expected.validated
+        assert result.non_validated == expected.non_validated
+        assert result.n_unique == expected.n_unique
+        assert result.n_empty == expected.n_empty
+        assert result.frac_validated == expected.frac_validated
+
+    result = inspect_stream([["a1cf"], ["A1BG"]], genes["symbol"], case_sensitive=False)
+    assert result.validated == ["a1cf", "A1BG"]
+    assert inspect_stream([], genes["symbol"]).n_unique == 0
+    # the identifiers aren't kept
+    with pytest.raises(ValueError, match="has no DataFrame"):
+        _ = inspect_stream([["a", "b"]], ["a"], mute=True).df
+
+
+def test_inspect_stream_sketch():
+    field_values = [f"t{i}" for i in range(1000)]
+    chunks = ([f"t{i}" for i in range(start, start + 10000)] for start in (0, 5000))
+    result = inspect_stream(chunks, field_values, max_terms=100, mute=True)
+    assert result.validated == [f"t{i}" for i in range(100)]
+    assert len(result.non_validated) == 100
+    assert result.non_validated[0] == "t1000"
+    # 1000 validated and 14000 non-validated distinct terms
+    assert result.n_unique == pytest.approx(15000, rel=0.05)
+    assert result.n_empty == pytest.approx(5000, rel=0.15)
@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 from lamin_utils._lookup import Lookup
 
 
@@ -88,3 +89,173 @@ def test_lookup_keyword_field():
     assert lookup.del_.value == 1
     assert lookup.class_.value == 2
     assert lookup.normal.value == 3
+
+
+def test_lookup_lazy():
+    df = pd.DataFrame(
+        {
+            "name": ["Sample 1", "Sample 1", "sample 1", "1 sample", "", None, "class"],
+            "meta1": ["a", "b", "c", "d", None, None, "e"],
+        }
+    )
+    for keep in ("first", "last", False):
+        eager = Lookup(df=df, field="name", prefix="prefix", keep=keep)
+        lazy = Lookup(df=df, field="name", prefix="prefix", keep=keep, lazy=True)
+        eager_lookup, lazy_lookup = eager.lookup(), lazy.lookup()
+        assert sorted(dir(lazy_lookup)) == sorted(eager_lookup._fields)
+        for key in ("prefix_1_sample", "class_"):
+            assert getattr(lazy_lookup, key) == getattr(eager_lookup, key)
+        assert lazy.lookup(return_field="meta1").class_ == "e"
+        assert lazy.dict() == eager.dict()
+
+    lazy_lookup = Lookup(df=df, field="name", keep="last", lazy=True).lookup()
+    assert lazy_lookup["sample_1"].meta1 == "c"
+    assert type(lazy_lookup.sample_1).__name__ == "MyTuple"
+    # records created on access are namedtuples
+    record = lazy_lookup.sample_1
+    assert isinstance(record, tuple)
+    assert record == ("sample 1", "c")
+    assert record._replace(meta1="x") == ("sample 1", "x")
+    assert type(record)._make(["1", "2"]).meta1 == "2"
+    with pytest.raises(AttributeError):
+        lazy_lookup.missing  # noqa: B018
+    with pytest.raises(KeyError):
+        lazy_lookup["missing"]
+
+
+def test_lookup_eager_tuple():
+    df = pd.DataFrame({"name": ["count", "index", "class"], "meta1": ["a", "b", "c"]})
+    inst = Lookup(df=df, field="name")
+    lookup = inst.lookup()
+    # records are created on access
+    assert inst._df_dict is None
+    assert lookup._fields == ("count", "index", "class_", "dict")
+    assert lookup.count == ("count", "a")
+    assert lookup.index.meta1 == "b"
+    assert lookup[2] == lookup.class_
+    assert lookup[:2] == (lookup.count, lookup.index)
+    assert tuple(lookup)[:3] == (("count", "a"), ("index", "b"), ("class", "c"))
+    assert lookup._asdict()["class_"].meta1 == "c"
+    assert "count" in dir(lookup)
+    assert lookup.dict() == inst.dict()
+    assert inst.lookup(return_field="meta1").count == "a"
+
+
+def test_lookup_cached(monkeypatch):
+    import lamin_utils._lookup
+
+    warnings: list[str] = []
+    monkeypatch.setattr(
+        lamin_utils._lookup.logger,
+        "warning",
+        lambda msg, **kwargs: warnings.append(msg),
+    )
+    df = pd.DataFrame(
+        {"name": ["experiment", "experiment", "other"], "value": ["v1", "v2", "v3"]}
+    )
+    inst = Lookup(df=df, field="name", keep="first")
+    lookup = inst.lookup()
+    assert inst.lookup() is lookup
+    assert inst.lookup(return_field="value") is not lookup
+    assert type(lookup).__name__ == "Lookup"
+    assert lookup._asdict()["other"].value == "v3"
+
+    # the duplicated key warns once, other keys are plain namedtuple fields
+    assert lookup.experiment.value == "v1"
+    assert lookup.experiment.value == "v1"
+    assert warnings == [
+        "2 records found for 'experiment'. Returning based on keep='first'."
+    ]
+    assert "other" not in type(lookup).__dict__
+
+    # clearing the cache builds a new lookup object that warns again
+    inst.clear_cache()
+    assert inst.lookup() is not lookup
+    assert inst.lookup().experiment.value == "v1"
+    assert len(warnings) == 2
+
+
+def test_lookup_key_collisions():
+    values = ["a b", "a-b", "A_B", "a b", "1!", 2, None, "!!"]
+    records = [["r0"], ["r1"], ["r2"], ["r3"], ["r4"], ["r5"], ["r6"], ["r7"]]
+    inst = Lookup(values=values, records=records, prefix="P", keep=False)
+    lookup = inst.lookup()
+    assert lookup._fields == ("a_b", "p_1_", "p__", "dict")
+    # values in order of first appearance
+    assert lookup.a_b._values == ["r0", "r1", "r2"]
+    assert lookup.p_1_ == "r4"
+    # unhashable records can't be deduplicated, only the first one is kept
+    assert inst.dict()["a b"] == ["r0"]
+
+
+def test_lookup_resolve_many():
+    df = pd.DataFrame(
+        {
+            "name": ["Sample 1", "sample 1", "1 sample", "class", "other"],
+            "meta1": ["a", "b", "c", "d", "e"],
+        }
+    )
+    keys = ["sample_1", "class_", "missing", None, "other", "sample_1", "class"]
+    for lazy in (False, True):
+        inst = Lookup(df=df, field="name", prefix="prefix", lazy=lazy)
+        records, missing = inst.resolve_many(keys)
+        assert missing.tolist() == [False, False, True, True, False, False, True]
+        lookup = inst.lookup()
+        assert records[0] == lookup.sample_1
+        assert records[1] == lookup.class_
+        assert records[2] is None
+
+        values, _ = inst.resolve_many(keys, return_field="meta1", keep="last")
+        assert values.tolist() == ["b", "d", None, None, "e", "b", None]
+        values, _ = inst.resolve_many(["sample_1", "other"], "meta1", keep=False)
+        assert values.tolist() == [["a", "b"], "e"]
+
+    records, missing = inst.resolve_many([])
+    assert len(records) == len(missing) == 0
+    with pytest.raises(ValueError):
+        inst.resolve_many(keys, keep="all")
+
+
+def test_lookup_pickle_save_load(tmp_path):
+    import pickle
+
+    df = pd.DataFrame(
+        {
+            "name": ["Sample 1", "sample 1", "1 sample", "class", "other"],
+            "meta1": ["a", "b", "c", "d", "e"],
+            "n": pd.array([1, 2, None, 4, 5], dtype="Int64"),
+        }
+    )
+    for lazy in (False, True):
+        inst = Lookup(df=df, field="name", prefix="prefix", keep=False, lazy=lazy)
+        inst.lookup()
+        restored = pickle.loads(pickle.dumps(inst))  # noqa: S301
+        assert restored._lazy is lazy
+        assert restored.dict() == inst.dict()
+        assert restored.lookup().sample_1 == inst.lookup().sample_1
+
+    object_df = df.astype({"meta1": object})
+    object_df.loc[2, "meta1"] = None
+    for i, (store, kwargs) in enumerate(
+        (
+            ("arrow", {"df": df, "field": "name"}),
+            # object columns aren't restored by Arrow
+            ("pkl", {"df": object_df, "field": "name"}),
+            ("pkl", {"values": df["name"], "records": list("vwxyz")}),
+        )
+    ):
+        inst = Lookup(tuple_name="Gene", **kwargs)
+        path = inst.save(tmp_path / f"{i}.lookup")
+        assert (path / f"records.{store}").exists()
+        for lazy in (False, True):
+            loaded = Lookup.load(path, lazy=lazy)
+            assert loaded.dict() == inst.dict()
+            assert loaded.lookup().class_ == inst.lookup().class_
+            records, missing = loaded.resolve_many(["sample_1", "missing"])
+            assert records[0] == inst.lookup().sample_1
+            assert missing.tolist() == [False, True]
+    assert Lookup.load(tmp_path / "1.lookup").dict()["1 sample"].meta1 is None
+    assert type(loaded.lookup().class_) is str
+
+    with pytest.raises(FileNotFoundError):
+        Lookup.load(tmp_path / "missing.lookup")
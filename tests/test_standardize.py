@@ -4,10 +4,11 @@ import pytest
 from lamin_utils._map_synonyms import (
     explode_aggregated_column_to_map,
     map_synonyms,
+    map_synonyms_chunks,
     not_empty_none_na,
     to_str,
 )
-from lamin_utils._standardize import standardize
+from lamin_utils._standardize import Standardizer, standardize, standardize_frame
 
 
 @pytest.fixture(scope="module")
@@ -83,6 +84,85 @@ def test_map_synonyms(genes):
     assert mapping == ["BRCA1", "A1BG"]
 
 
+def test_map_synonyms_chunks(genes):
+    gene_symbols, df = genes
+
+    identifiers = gene_symbols + ["fancd1", None, "", "GCS"]
+    chunks = (identifiers[i : i + 3] for i in range(0, len(identifiers), 3))
+    mapped = list(map_synonyms_chunks(df, chunks, field="symbol"))
+    assert [len(chunk) for chunk in mapped] == [3, 3, 3]
+    assert sum(mapped, []) == map_synonyms(df, identifiers, field="symbol")
+
+    mapped = map_synonyms_chunks(
+        df, [["GCS"], [], ["A1CF"]], field="symbol", keep=False
+    )
+    assert list(mapped) == [[["GCLC", "UGCG"]], [], ["A1CF"]]
+
+
+@pytest.mark.parametrize("keep", ["first", "last", False])
+@pytest.mark.parametrize("case_sensitive", [True, False])
+def test_map_synonyms_engines_agree(genes, keep, case_sensitive):
+    from lamin_utils._map_synonyms import _map_values, _SynonymLookup
+
+    _, df = genes
+    identifiers = ["A1CF", "a1cf", "fancd1", "GCS", "gcs", "BRCC1", "", None, "X"]
+    kwargs = {"field": "symbol", "keep": keep, "case_sensitive": case_sensitive}
+
+    # the dict engine of single calls and the reusable pandas lookup tables
+    mapped = _map_values(df, identifiers, synonyms_field="synonyms", sep="|", **kwargs)
+    assert _SynonymLookup(df, **kwargs).map(identifiers) == mapped
+
+    # lowercasing a final sigma or a dotted capital I differs from str.lower
+    df = pd.DataFrame(
+        {"symbol": ["ασ", "Istanbul", "T1"], "synonyms": ["", "", "ΚΣ|İzmir"]}
+    )
+    identifiers = ["ΑΣ", "İstanbul", "κσ", "İZMIR", "izmir"]
+    mapped = _map_values(df, identifiers, synonyms_field="synonyms", sep="|", **kwargs)
+    assert _SynonymLookup(df, **kwargs).map(identifiers) == mapped
+    if not case_sensitive:
+        expected = ["ασ", "Istanbul", "T1", "T1", "T1"]
+        assert [m[0] if isinstance(m, list) else m for m in mapped] == expected
+
+
+def test_map_synonyms_return_positions(genes):
+    gene_symbols, df = genes
+
+    identifiers = gene_symbols + [None]
+    positions = map_synonyms(df, identifiers, field="symbol", return_positions=True)
+    assert positions.tolist() == [3, 1, 2, -1, 4, -1]
+    mapped = df["symbol"].to_numpy()[positions[positions >= 0]]
+    assert mapped.tolist() == ["A1CF", "A1BG", "BRCA2", "GCLC"]
+    assert (
+        standardize(
+            df,
+            identifiers,
+            field="symbol",
+            return_field="ensembl_gene_id",
+            return_positions=True,
+        ).tolist()
+        == positions.tolist()
+    )
+
+    positions = map_synonyms(
+        df, ["BRCA1-1", "GCS"], field="symbol", keep="last", return_positions=True
+    )
+    assert positions.tolist() == [7, 5]
+    positions = map_synonyms(
+        df, ["A1CF", "GCS"], field="symbol", synonyms_field=None, return_positions=True
+    )
+    assert positions.tolist() == [3, -1]
+    assert map_synonyms(df, [], field="symbol", return_positions=True).tolist() == []
+
+    with pytest.raises(ValueError):
+        map_synonyms(
+            df, gene_symbols, field="symbol", keep=False, return_positions=True
+        )
+    with pytest.raises(ValueError):
+        map_synonyms(
+            df, gene_symbols, field="symbol", return_mapper=True, return_positions=True
+        )
+
+
 def test_map_synonyms_field_synonym(genes):
     _, df = genes
 
@@ -215,6 +295,22 @@ def test_to_str():
     ).tolist() == ["A", "a", "", ""]
 
 
+def test_to_str_arrow():
+    pytest.importorskip("pyarrow")
+
+    values = pd.Series(["A", "a", None], index=["x", "y", "z"], dtype="string[pyarrow]")
+    lowered = to_str(values)
+    assert lowered.tolist() == ["a", "a", ""]
+    assert lowered.index.tolist() == ["x", "y", "z"]
+    assert lowered.dtype == values.dtype
+    assert to_str(values, case_sensitive=True).tolist() == ["A", "a", ""]
+
+    # mutating a result doesn't affect the input
+    lowered.iloc[0] = "b"
+    assert values.iloc[:2].tolist() == ["A", "a"]
+    assert to_str(values).tolist() == ["a", "a", ""]
+
+
 def test_not_empty_none_na():
     assert not_empty_none_na(["a", None, "", np.nan]).loc[0] == "a"
     assert not_empty_none_na(pd.Index(["a", None, "", np.nan])).tolist() == ["a"]
@@ -346,6 +442,85 @@ def test_standardize_keep(genes):
     ]
 
 
+def test_standardizer(genes):
+    gene_symbols, df = genes
+    standardizer = Standardizer(df, field="symbol")
+    results = standardizer.standardize(
+        gene_symbols, return_field=["symbol", "ensembl_gene_id"]
+    )
+    assert results == {
+        "symbol": ["A1CF", "A1BG", "BRCA2", "FANCD20", "GCLC"],
+        "ensembl_gene_id": standardize(
+            df, gene_symbols, field="symbol", return_field="ensembl_gene_id"
+        ),
+    }
+    assert standardizer.standardize(
+        gene_symbols, return_field="ensembl_gene_id", return_mapper=True
+    ) == standardize(
+        df,
+        gene_symbols,
+        field="symbol",
+        return_field="ensembl_gene_id",
+        return_mapper=True,
+    )
+    assert standardizer.standardize(gene_symbols) == map_synonyms(
+        df, gene_symbols, field="symbol"
+    )
+
+    standardizer = Standardizer(df, field="symbol", keep=False)
+    assert standardizer.standardize(
+        ["A1CF", "FANCD1", "BRCA1-1"], return_field="ensembl_gene_id"
+    ) == [
+        "ENSG00000148584",
+        "ENSG00000139618",
+        ["ENSG00000012048-1", "ENSG00000012048-1-1"],
+    ]
+
+    with pytest.raises(KeyError):
+        standardizer.standardize(gene_symbols, return_field="ontology_id")
+
+
+def test_standardize_frame(genes):
+    _, df = genes
+    obs = pd.DataFrame(
+        {
+            "gene": pd.Categorical(["FANCD1", "a1cf", None, "GCS", "FANCD20"]),
+            "gene_id": ["GCS", "A1BG", "FANCD1", None, "FANCD1"],
+            "other": [1, 2, 3, 4, 5],
+        }
+    )
+    standardized, stats = standardize_frame(
+        obs,
+        {
+            "gene": {"df": df, "field": "symbol"},
+            "gene_id": {
+                "df": df,
+                "field": "symbol",
+                "return_field": "ensembl_gene_id",
+            },
+        },
+        n_jobs=2,
+    )
+    assert isinstance(standardized["gene"].dtype, pd.CategoricalDtype)
+    assert standardized["gene"].tolist()[:2] == ["BRCA2", "A1CF"]
+    assert pd.isna(standardized["gene"][2])
+    assert standardized["gene"].tolist()[3:] == ["GCLC", "FANCD20"]
+    assert standardized["gene_id"].dropna().tolist() == standardize(
+        df,
+        ["GCS", "A1BG", "FANCD1", "FANCD1"],
+        field="symbol",
+        return_field="ensembl_gene_id",
+    )
+    assert standardized["other"].tolist() == obs["other"].tolist()
+    assert stats.to_dict(orient="index") == {
+        "gene": {"n_unique": 4, "n_mapped": 3, "n_standardized": 3},
+        "gene_id": {"n_unique": 3, "n_mapped": 3, "n_standardized": 2},
+    }
+
+    with pytest.raises(KeyError):
+        standardize_frame(obs, {"tissue": Standardizer(df, field="symbol")})
+
+
 def test_map_synonyms_field_match_first(genes):
     _, df = genes
 
@@ -0,0 +1,109 @@
+import pandas as pd
+import pytest
+from lamin_utils._standardize import standardize
+from lamin_utils._standardize_parquet import standardize_parquet
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture(scope="module")
+def cell_types():
+    return pd.DataFrame(
+        {
+            "name": ["T cell", "B cell", "neuron"],
+            "synonyms": ["T-cell|T lymphocyte", "B lymphocyte", "nerve cell"],
+            "ontology_id": ["CL:0000084", "CL:0000236", "CL:0000540"],
+            "ontology_number": [84, 236, 540],
+        }
+    )
+
+
+def test_standardize_parquet(tmp_path, cell_types):
+    values = ["T-cell", "b cell", None, "neuron", "unknown", "nerve cell"] * 5
+    for i in range(2):
+        pq.write_table(
+            pa.table({"cell_type": values, "n": list(range(len(values)))}),
+            tmp_path / f"part-{i}.parquet",
+            row_group_size=4,
+        )
+    pq.write_table(
+        pa.table({"cell_type": pa.array(values).dictionary_encode()}),
+        tmp_path / "part-2.parquet",
+    )
+
+    paths = standardize_parquet(
+        tmp_path,
+        tmp_path / "standardized",
+        "cell_type",
+        cell_types,
+        field="name",
+        return_field="ontology_id",
+        n_jobs=2,
+    )
+    assert [path.name for path in paths] == [
+        "part-0.parquet",
+        "part-1.parquet",
+        "part-2.parquet",
+    ]
+    expected = standardize(cell_types, values, field="name", return_field="ontology_id")
+    for path in paths:
+        table = pq.read_table(path)
+        assert table.column("cell_type").to_pylist() == expected
+        assert table.schema == pq.read_schema(tmp_path / path.name)
+    assert pq.ParquetFile(paths[0]).num_row_groups == 8
+    assert pq.read_table(paths[0]).column("n").to_pylist() == list(range(30))
+
+
+def test_standardize_parquet_single_file(tmp_path, cell_types):
+    pq.write_table(
+        pa.table({"cell_type": ["t-cell", "B lymphocyte"]}), tmp_path / "a.parquet"
+    )
+    standardize_parquet(
+        tmp_path / "a.parquet", tmp_path / "b.parquet", "cell_type", cell_types, "name"
+    )
+    table = pq.read_table(tmp_path / "b.parquet")
+    assert table.column("cell_type").to_pylist() == ["T cell", "B cell"]
+
+    with pytest.raises(KeyError):
+        standardize_parquet(
+            tmp_path / "a.parquet", tmp_path / "c.parquet", "tissue", cell_types, "name"
+        )
+
+
+def test_standardize_parquet_return_type(tmp_path, cell_types):
+    values = ["T-cell", "unknown", None, "neuron"]
+    pq.write_table(pa.table({"cell_type": values}), tmp_path / "a.parquet")
+    pq.write_table(
+        pa.table({"cell_type": pa.array(values).dictionary_encode()}),
+        tmp_path / "b.parquet",
+    )
+    for name in ("a", "b"):
+        standardize_parquet(
+            tmp_path / f"{name}.parquet",
+            tmp_path / f"{name}_ids.parquet",
+            "cell_type",
+            cell_types,
+            "name",
+            return_field="ontology_number",
+        )
+        column = pq.read_table(tmp_path / f"{name}_ids.parquet").column("cell_type")
+        # unmapped values can't keep their strings in an integer column
+        assert column.to_pylist() == [84, None, None, 540]
+    assert pa.types.is_integer(pq.read_schema(tmp_path / "a_ids.parquet")[0].type)
+
+
+def test_standardize_parquet_same_names(tmp_path, cell_types):
+    for directory in ("x", "y"):
+        (tmp_path / directory).mkdir()
+        pq.write_table(
+            pa.table({"cell_type": ["T-cell"]}), tmp_path / directory / "a.parquet"
+        )
+    with pytest.raises(ValueError, match="same name"):
+        standardize_parquet(
+            [tmp_path / "x" / "a.parquet", tmp_path / "y" / "a.parquet"],
+            tmp_path / "out",
+            "cell_type",
+            cell_types,
+            "name",
+        )
@@ -0,0 +1,40 @@
+import pandas as pd
+from lamin_utils._map_synonyms import map_synonyms
+from lamin_utils._synonym_delta import SynonymDelta
+
+
+def test_synonym_delta():
+    old_df = pd.DataFrame(
+        {
+            "name": ["T cell", "B cell", "neuron", "astrocyte"],
+            "synonyms": ["T-cell|T lymphocyte", "B lymphocyte", "nerve cell", ""],
+        }
+    )
+    new_df = pd.DataFrame(
+        {
+            "name": ["T cell", "B cell", "neuron", "glial cell"],
+            "synonyms": ["T-cell", "B lymphocyte|B-cell", "nerve cell", "astrocyte"],
+        }
+    )
+    identifiers = ["t-cell", "T lymphocyte", "B-cell", "nerve cell", "astrocyte"]
+    mapper = map_synonyms(old_df, identifiers, field="name", return_mapper=True)
+    assert mapper == {
+        "t-cell": "T cell",
+        "T lymphocyte": "T cell",
+        "nerve cell": "neuron",
+    }
+
+    delta = SynonymDelta.from_dfs(old_df, new_df, field="name")
+    # astrocyte and glial cell as values and case-folded keys
+    # plus the changed synonyms t lymphocyte and b-cell
+    assert len(delta) == 6
+    assert delta.affected(identifiers) == ["T lymphocyte", "B-cell", "astrocyte"]
+
+    updated = delta.apply(mapper, identifiers=identifiers)
+    assert updated == map_synonyms(
+        new_df, identifiers, field="name", return_mapper=True
+    )
+    assert delta.apply(mapper) == {
+        "t-cell": "T cell",
+        "nerve cell": "neuron",
+    }
@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+from lamin_utils._map_synonyms import explode_aggregated_column_to_map
+from lamin_utils._synonym_store import SynonymStore
+
+
+@pytest.fixture(scope="module")
+def df():
+    return pd.DataFrame(
+        {
+            "symbol": ["BRCA2", "A1CF", "GCLC", "UGCG", "Gclc", "A1BG"],
+            "synonyms": [
+                "FAD|FAD1|FANCD1",
+                "ACF|ACF64|asp",
+                "GCS|BRCA2",
+                "GCS",
+                "gcs|Asp",
+                None,
+            ],
+        }
+    )
+
+
+@pytest.mark.parametrize("keep", ["first", "last", False])
+def test_synonym_store_matches_explode(df, keep):
+    store = SynonymStore.from_df(df, field="symbol")
+    expected = explode_aggregated_column_to_map(
+        df, agg_col="synonyms", target_col="symbol", keep=keep
+    )
+    assert store.to_series(keep=keep).to_dict() == expected.to_dict()
+    assert len(store) == len(expected)
+
+
+def test_synonym_store_get(df):
+    store = SynonymStore.from_df(df, field="symbol")
+
+    assert store.get("FANCD1") == "BRCA2"
+    assert store.get("fancd1") is None
+    assert store.get("fancd1", case_sensitive=False) == "BRCA2"
+    assert store.get("GCS", keep="last") == "UGCG"
+    assert store.get("GCS", keep=False) == ["GCLC", "UGCG"]
+    # case-folded duplicates resolve to the first synonym in sorted order
+    assert store.get("gcs", case_sensitive=False) == "GCLC"
+    assert store.get("ASP", case_sensitive=False) == "Gclc"
+    assert store.map(["FAD", "BRCA2", None, "gcs"], case_sensitive=True) == [
+        "BRCA2",
+        "GCLC",
+        None,
+        "Gclc",
+    ]
+
+
+def test_synonym_store_memory_usage(df):
+    store = SynonymStore.from_df(df, field="symbol")
+    assert store.memory_usage() > 0
+
+    empty = SynonymStore.from_df(df.iloc[:0], field="symbol")
+    assert len(empty) == 0
+    assert empty.map(["FAD"]) == [None]
+
+
+def test_synonym_store_mixed_types():
+    from lamin_utils._map_synonyms import _SynonymLookup
+
+    df = pd.DataFrame(
+        {"symbol": ["A", "B", "C"], "synonyms": ["x|y", 5, "z"]}, dtype=object
+    )
+    store = SynonymStore.from_df(df, field="symbol")
+    expected = explode_aggregated_column_to_map(
+        df, agg_col="synonyms", target_col="symbol"
+    )
+    assert expected.to_dict() == {"x": "A", "y": "A", "z": "C"}
+    assert store.to_series().to_dict() == expected.to_dict()
+    assert store.get("z") == "C"
+    assert _SynonymLookup(df, field="symbol").map(["z", "x"]) == ["C", "A"]
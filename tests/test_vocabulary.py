@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+from lamin_utils._inspect import inspect, validate
+from lamin_utils._vocabulary import HashedVocabulary, SortedVocabulary
+
+
+@pytest.fixture
+def field_values():
+    return pd.Series(["A1CF", "A2M", "BRCA2", "ÄBC", None, "a2m"])
+
+
+@pytest.mark.parametrize("vocabulary_type", [HashedVocabulary, SortedVocabulary])
+def test_vocabulary(vocabulary_type, field_values, tmp_path):
+    vocabulary = vocabulary_type.build(field_values, tmp_path / "genes.vocab")
+    assert len(vocabulary) == 6
+    identifiers = ["A1CF", "a1cf", "ÄBC", "äbc", None, "XYZ", 1, "", "A1CF2"]
+    for case_sensitive in (True, False):
+        expected = validate(identifiers, field_values, case_sensitive=case_sensitive)
+        np.testing.assert_array_equal(
+            validate(identifiers, vocabulary, case_sensitive=case_sensitive), expected
+        )
+
+    # reopening memory-maps the same files
+    reopened = vocabulary_type(vocabulary.path)
+    assert reopened.isin(["A2M", "a2M"]).tolist() == [True, False]
+    assert reopened.isin(["A2M", "a2M"], case_sensitive=False).tolist() == [
+        True,
+        True,
+    ]
+
+
+@pytest.mark.parametrize("vocabulary_type", [HashedVocabulary, SortedVocabulary])
+def test_vocabulary_empty(vocabulary_type, tmp_path):
+    vocabulary = vocabulary_type.build([], tmp_path / "empty.vocab")
+    assert len(vocabulary) == 0
+    assert vocabulary.isin(["A1CF"]).tolist() == [False]
+    with pytest.raises(FileNotFoundError):
+        vocabulary_type(tmp_path / "missing.vocab")
+
+
+def test_hashed_vocabulary_many(tmp_path):
+    field_values = pd.Series([f"ENSG{i:011d}" for i in range(20000)])
+    vocabulary = HashedVocabulary.build(
+        field_values, tmp_path / "genes.vocab", false_positive_rate=0.2
+    )
+    identifiers = [f"ENSG{i:011d}" for i in range(19000, 21000)]
+    matches = vocabulary.isin(identifiers)
+    assert matches.sum() == 1000
+    assert matches[:1000].all()
+
+
+def test_sorted_vocabulary_prefix(tmp_path):
+    field_values = ["abc", "abcdef", "abcdeg", "ab\0", "xyz\0\0"]
+    vocabulary = SortedVocabulary.build(
+        field_values, tmp_path / "names.vocab", prefix_length=4
+    )
+    identifiers = ["abc", "abcd", "abcdef", "abcdeh", "ab", "ab\0", "xyz", "xyz\0\0"]
+    assert vocabulary.isin(identifiers).tolist() == [
+        True,
+        False,
+        True,
+        False,
+        False,
+        True,
+        False,
+        True,
+    ]
+    with pytest.raises(ValueError):
+        HashedVocabulary(vocabulary.path)
+
+
+def test_inspect_vocabulary(tmp_path):
+    df = pd.DataFrame({"symbol": ["A1CF", "A2M", "BRCA2"], "synonyms": ["", "", ""]})
+    vocabulary = SortedVocabulary.build(df["symbol"], tmp_path / "genes.vocab")
+    identifiers = ["A1CF", "a2m", "XYZ", "A1CF", None]
+    result = inspect(vocabulary, identifiers, field="symbol")
+    expected = inspect(df, identifiers, field="symbol")
+    assert result.validated == expected.validated == ["A1CF"]
+    assert result.non_validated == expected.non_validated
+    assert result.synonyms_mapper == {}
+
+
+@pytest.mark.parametrize("vocabulary_type", [HashedVocabulary, SortedVocabulary])
+def test_vocabulary_numeric(vocabulary_type, tmp_path):
+    field_values = pd.Series([9606, 10090, 7227])
+    vocabulary = vocabulary_type.build(field_values, tmp_path / "taxa.vocab")
+    assert len(vocabulary) == 3
+    identifiers = [9606, 10090.0, 1, np.int64(7227)]
+    expected = validate(identifiers, field_values)
+    assert expected.tolist() == [True, True, False, True]
+    np.testing.assert_array_equal(validate(identifiers, vocabulary), expected)
+    assert vocabulary_type(vocabulary.path).isin([9606.0]).tolist() == [True]
+    # the type compatibility check is the same as for in-memory references
+    with pytest.raises(TypeError):
+        validate(["9606"], vocabulary)
+    with pytest.raises(TypeError):
+        inspect(vocabulary, ["9606"], field="taxon_id")
+
+
+def test_sorted_vocabulary_numeric_prefix(tmp_path):
+    field_values = pd.Series([123456789, 123456780, 12.5])
+    vocabulary = SortedVocabulary.build(
+        field_values, tmp_path / "ids.vocab", prefix_length=4
+    )
+    assert vocabulary.isin([123456789, 123456789.0, 12345678, 12.5]).tolist() == [
+        True,
+        True,
+        False,
+        True,
+    ]